@@ -9,6 +9,7 @@ from rest_framework.response import Response
 from apps.core.audit import AuditMixin
 from apps.users.permissions import IsAdminUser
 from apps.core.realtime import publish_event
+from apps.fuel.cache import invalidate_dashboard_summary
 
 from .models import Alert
 from .serializers import AlertListSerializer, AlertSerializer
@@ -125,6 +126,8 @@ class AlertViewSet(AuditMixin, viewsets.ModelViewSet):
         ).update(resolved_at=timezone.now())
 
         if updated:
+            # queryset.update() sends no post_save
+            invalidate_dashboard_summary()
             publish_event({
                 'type': 'ALERT_RESOLVED_BULK',
                 'alert_count': updated,
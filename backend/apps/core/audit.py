@@ -8,7 +8,11 @@ import uuid
 from datetime import date, datetime
 from decimal import Decimal
 
+from django.conf import settings
+from django.db import transaction
+
 from .models import AuditAction, AuditLog
+from .tasks import write_audit_log_task
 
 
 def get_client_ip(request):
@@ -104,7 +108,7 @@ class AuditMixin:
             user = self.request.user if self.request.user.is_authenticated else None
             ip_address = get_client_ip(self.request)
 
-            AuditLog.log(
+            fields = AuditLog.entry_fields(
                 user=user,
                 action=action,
                 entity=instance,
@@ -112,6 +116,11 @@ class AuditMixin:
                 new_data=new_data,
                 ip_address=ip_address,
             )
+            if settings.AUDIT_ASYNC:
+                # Queue the write once the change itself is committed
+                transaction.on_commit(lambda: write_audit_log_task.delay(fields))
+            else:
+                AuditLog.objects.create(**fields)
         except Exception as e:
             # Don't let audit logging break the main operation
             import logging
@@ -0,0 +1,84 @@
+"""
+Fail-open Redis cache backend.
+
+The cache only saves work (dashboards, user profile, latest prices, throttle
+history, login blocks). When Redis is unreachable, reads miss and writes are
+dropped, so requests are computed from the database instead of failing
+with 500.
+"""
+import logging
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.redis import RedisCache
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+def _log_failure(operation, exc):
+    logger.warning('Cache unavailable, skipping %s: %s', operation, exc)
+
+
+class FailOpenRedisCache(RedisCache):
+    """RedisCache whose reads and writes degrade to cache misses on Redis errors."""
+
+    def get(self, key, default=None, version=None):
+        try:
+            return super().get(key, default, version)
+        except RedisError as exc:
+            _log_failure('get', exc)
+            return default
+
+    def get_many(self, keys, version=None):
+        try:
+            return super().get_many(keys, version)
+        except RedisError as exc:
+            _log_failure('get_many', exc)
+            return {}
+
+    def has_key(self, key, version=None):
+        try:
+            return super().has_key(key, version)
+        except RedisError as exc:
+            _log_failure('has_key', exc)
+            return False
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        try:
+            return super().add(key, value, timeout, version)
+        except RedisError as exc:
+            _log_failure('add', exc)
+            return False
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        try:
+            super().set(key, value, timeout, version)
+        except RedisError as exc:
+            _log_failure('set', exc)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        try:
+            return super().set_many(data, timeout, version)
+        except RedisError as exc:
+            _log_failure('set_many', exc)
+            return list(data)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        try:
+            return super().touch(key, timeout, version)
+        except RedisError as exc:
+            _log_failure('touch', exc)
+            return False
+
+    def delete(self, key, version=None):
+        try:
+            return super().delete(key, version)
+        except RedisError as exc:
+            _log_failure('delete', exc)
+            return False
+
+    def delete_many(self, keys, version=None):
+        try:
+            super().delete_many(keys, version)
+        except RedisError as exc:
+            _log_failure('delete_many', exc)
@@ -12,6 +12,7 @@ import re
 from urllib.parse import unquote
 
 from django.http import HttpResponseBadRequest
+from django.urls import Resolver404, resolve
 
 logger = logging.getLogger('security')
 
@@ -101,6 +102,8 @@ class WAFMiddleware:
 
         # Check POST data (only for form data, not file uploads)
         if request.method == 'POST' and request.content_type in ['application/x-www-form-urlencoded', 'multipart/form-data']:
+            if request.content_type == 'multipart/form-data':
+                self._install_upload_handlers(request)
             for key, value in request.POST.items():
                 if isinstance(value, str) and self._is_malicious(value, request, key):
                     return self._block_request(request, 'post_data', f"{key}={value[:50]}")
@@ -145,6 +148,24 @@ class WAFMiddleware:
 
         return False
 
+    @staticmethod
+    def _install_upload_handlers(request):
+        """
+        Apply the target view's `upload_handler_classes`, if any.
+
+        Reading request.POST below parses the multipart body, so views that
+        need custom upload handlers (e.g. size limits) must get them here.
+        """
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return
+
+        view_class = getattr(match.func, 'view_class', None)
+        handler_classes = getattr(view_class, 'upload_handler_classes', None)
+        if handler_classes:
+            request.upload_handlers = [handler_class(request) for handler_class in handler_classes]
+
     def _check_path_traversal(self, path: str) -> bool:
         """Check if path contains traversal attempts."""
         decoded_path = unquote(path).lower()
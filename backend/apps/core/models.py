@@ -2,6 +2,7 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class FuelType(models.TextChoices):
@@ -174,7 +175,8 @@ class AuditLog(models.Model):
     Records who did what, when, and the before/after state.
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    timestamp = models.DateTimeField('Data/Hora', auto_now_add=True, db_index=True)
+    # Set by entry_fields() when the action happens, not when the row is written
+    timestamp = models.DateTimeField('Data/Hora', default=timezone.now, editable=False, db_index=True)
 
     # Who
     user = models.ForeignKey(
@@ -218,8 +220,20 @@ class AuditLog(models.Model):
 
     @classmethod
     def log(cls, user, action, entity, old_data=None, new_data=None, ip_address=None):
+        """Create an audit log entry (arguments as in entry_fields())."""
+        return cls.objects.create(
+            **cls.entry_fields(user, action, entity, old_data, new_data, ip_address)
+        )
+
+    @classmethod
+    def entry_fields(cls, user, action, entity, old_data=None, new_data=None, ip_address=None):
         """
-        Create an audit log entry.
+        Build the field values of an audit log entry (serializable by
+        Celery's JSON serializer).
+
+        Everything is resolved up front, including the timestamp, so the
+        entry can be written later (e.g. by a Celery task) even after the
+        entity has been deleted, and still record when the action happened.
 
         Args:
             user: The user performing the action
@@ -239,8 +253,9 @@ class AuditLog(models.Model):
                 if old_val != new_val:
                     changes[key] = {'old': old_val, 'new': new_val}
 
-        return cls.objects.create(
-            user=user,
+        return dict(
+            timestamp=timezone.now(),
+            user_id=user.pk if user else None,
             username=user.username if user else 'Sistema',
             ip_address=ip_address,
             action=action,
@@ -0,0 +1,28 @@
+"""
+Fast JSON renderer backed by orjson.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_drf_encoder = JSONEncoder()
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer (the project default).
+
+    orjson encodes dicts, lists, strings, numbers and UUIDs in C. Anything
+    else (Decimal, lazy strings, querysets...) goes through DRF's own
+    encoder, so the output matches the stock renderer. Datetimes are passed
+    through too: DRF trims them to milliseconds, orjson would not.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_drf_encoder.default, option=_OPTIONS)
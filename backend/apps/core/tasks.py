@@ -0,0 +1,16 @@
+"""
+Celery tasks for core app.
+"""
+from celery import shared_task
+
+
+@shared_task(ignore_result=True)
+def write_audit_log_task(fields):
+    """
+    Write an audit log entry built by AuditLog.entry_fields().
+
+    Used when AUDIT_ASYNC is enabled to keep the INSERT out of the request.
+    """
+    from apps.core.models import AuditLog
+
+    AuditLog.objects.create(**fields)
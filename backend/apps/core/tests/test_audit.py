@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.core.models import AuditAction, AuditLog
+
+pytestmark = pytest.mark.django_db
+
+
+VEHICLE_PAYLOAD = {
+    "plate": "CCC3C33",
+    "name": "Saveiro",
+    "model": "2022",
+    "fuel_type": "GASOLINE",
+    "usage_category": "OPERATIONAL",
+    "active": True,
+}
+
+
+@pytest.mark.parametrize("audit_async", [False, True])
+def test_vehicle_create_is_audited(
+    settings, admin_api_client, admin_user, audit_async, django_capture_on_commit_callbacks
+):
+    settings.AUDIT_ASYNC = audit_async
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = admin_api_client.post("/api/vehicles/", VEHICLE_PAYLOAD, format="json")
+
+    assert response.status_code == 201
+    entry = AuditLog.objects.get(entity_id=response.data["id"])
+    assert entry.action == AuditAction.CREATE
+    assert entry.user == admin_user
+    assert entry.new_data["plate"] == "CCC3C33"
+
+
+def test_async_audit_survives_deleted_entity(settings, admin_api_client, django_capture_on_commit_callbacks):
+    settings.AUDIT_ASYNC = True
+    vehicle_id = admin_api_client.post("/api/vehicles/", VEHICLE_PAYLOAD, format="json").data["id"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = admin_api_client.delete(f"/api/vehicles/{vehicle_id}/")
+
+    assert response.status_code == 204
+    entry = AuditLog.objects.get(entity_id=vehicle_id, action=AuditAction.DELETE)
+    assert entry.old_data["plate"] == "CCC3C33"
+
+
+def test_async_audit_keeps_the_action_time(
+    settings, admin_api_client, monkeypatch, django_capture_on_commit_callbacks
+):
+    settings.AUDIT_ASYNC = True
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        before = timezone.now()
+        response = admin_api_client.post("/api/vehicles/", VEHICLE_PAYLOAD, format="json")
+        after = timezone.now()
+
+    # The task only runs an hour later (queue backlog)
+    monkeypatch.setattr(timezone, "now", lambda: after + timedelta(hours=1))
+    for callback in callbacks:
+        callback()
+
+    entry = AuditLog.objects.get(entity_id=response.data["id"])
+    assert before <= entry.timestamp <= after
@@ -0,0 +1,36 @@
+import pytest
+from django.test import override_settings
+
+from apps.core.cache_backends import FailOpenRedisCache
+
+UNREACHABLE_REDIS = "redis://127.0.0.1:1/0"
+FAIL_OPEN_CACHES = {
+    "default": {
+        "BACKEND": "apps.core.cache_backends.FailOpenRedisCache",
+        "LOCATION": UNREACHABLE_REDIS,
+        "OPTIONS": {"socket_connect_timeout": 0.2, "socket_timeout": 0.2},
+    }
+}
+
+
+def test_fail_open_cache_degrades_to_misses_when_redis_is_down():
+    cache = FailOpenRedisCache(UNREACHABLE_REDIS, FAIL_OPEN_CACHES["default"])
+
+    assert cache.get("key", "fallback") == "fallback"
+    assert cache.get_or_set("key", lambda: "computed") == "computed"
+    assert cache.get_many(["a", "b"]) == {}
+    assert cache.add("key", 1) is False
+    assert cache.set_many({"a": 1}) == ["a"]
+    cache.set("key", 1)
+    cache.delete_many(["a", "b"])
+    assert cache.delete("key") is False
+
+
+@pytest.mark.django_db
+@override_settings(CACHES=FAIL_OPEN_CACHES)
+def test_cached_endpoints_answer_when_redis_is_down(admin_api_client):
+    response = admin_api_client.get("/api/dashboard/summary/")
+    assert response.status_code == 200
+
+    response = admin_api_client.get("/api/auth/profile/")
+    assert response.status_code == 200
@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from django.utils import timezone
+
+
+def test_health_check_reports_ok(client):
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    data = response.json()
+    assert data["status"] == "ok"
+    timestamp = datetime.fromisoformat(data["timestamp"])
+    assert abs((timezone.now() - timestamp).total_seconds()) < 5
@@ -0,0 +1,28 @@
+import json
+import uuid
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import ORJSONRenderer
+
+
+def test_orjson_renderer_matches_drf_json_renderer():
+    data = {
+        "id": uuid.uuid4(),
+        "total": Decimal("123.45"),
+        "day": date(2025, 1, 15),
+        "at": datetime(2025, 1, 15, 8, 30, 15, 123456, tzinfo=dt_timezone.utc),
+        "items": [{"liters": Decimal("40.000")}],
+        "empty": None,
+        1: "int key",
+    }
+
+    rendered = json.loads(ORJSONRenderer().render(data))
+
+    assert rendered == json.loads(JSONRenderer().render(data))
+
+
+def test_orjson_renderer_renders_none_as_empty_body():
+    assert ORJSONRenderer().render(None) == b""
@@ -44,3 +44,10 @@ def test_driver_sees_only_current_vehicle(driver_api_client, vehicle_operational
     assert response.status_code == 200
     assert response.data["count"] == 1
     assert response.data["results"][0]["id"] == str(vehicle_operational.id)
+
+
+def test_admin_lists_whole_fleet(admin_api_client, seed_fleet):
+    response = admin_api_client.get("/api/vehicles/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == len(seed_fleet["vehicles"])
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import FuelPriceSnapshot, FuelTransaction
+from .models import FuelPriceSnapshot, FuelTransaction, FuelTransactionImport
 
 
 @admin.register(FuelTransaction)
@@ -23,3 +23,11 @@ class FuelPriceSnapshotAdmin(admin.ModelAdmin):
     search_fields = ['station__name']
     date_hierarchy = 'collected_at'
     ordering = ['-collected_at']
+
+
+@admin.register(FuelTransactionImport)
+class FuelTransactionImportAdmin(admin.ModelAdmin):
+    list_display = ['file', 'status', 'created_by', 'created_at', 'finished_at']
+    list_filter = ['status']
+    ordering = ['-created_at']
+    readonly_fields = ['task_id', 'result', 'created_at', 'updated_at', 'finished_at']
@@ -0,0 +1,105 @@
+"""
+Cache helpers for fuel dashboards.
+
+Dashboard payloads are cached for a short TTL and invalidated by the
+FuelTransaction (and, for the admin summary, price snapshot and alert)
+signals whenever the underlying rows change.
+"""
+from datetime import datetime, time, timedelta
+from time import time_ns
+
+from django.core.cache import cache
+from django.utils import timezone
+
+DRIVER_DASHBOARD_WINDOW_DAYS = 30
+DRIVER_DASHBOARD_TTL = 60  # seconds
+
+DASHBOARD_SUMMARY_TTL = 300  # seconds
+DASHBOARD_SUMMARY_VERSION_KEY = 'dashboard_summary:version'
+
+LATEST_FUEL_PRICE_TTL = 30  # seconds
+
+
+def driver_dashboard_since(today=None):
+    """First day of the driver dashboard window."""
+    today = today or timezone.localdate()
+    return today - timedelta(days=DRIVER_DASHBOARD_WINDOW_DAYS)
+
+
+def local_day_start(day):
+    """
+    Aware datetime at local midnight of `day`.
+
+    Filtering with purchased_at__gte=<datetime> keeps the predicate index
+    friendly, unlike purchased_at__date__gte which casts the column.
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def local_days_filter(from_date, to_date):
+    """purchased_at range lookups covering local days from_date..to_date (inclusive)."""
+    return {
+        'purchased_at__gte': local_day_start(from_date),
+        'purchased_at__lt': local_day_start(to_date + timedelta(days=1)),
+    }
+
+
+def driver_dashboard_key(driver_id, since):
+    """Cache key for a driver dashboard (window start makes it expire daily)."""
+    return f'driver_dashboard:{driver_id}:{since.isoformat()}'
+
+
+def invalidate_driver_dashboard(*driver_ids):
+    """Drop cached dashboards for the given drivers."""
+    since = driver_dashboard_since()
+    keys = [driver_dashboard_key(driver_id, since) for driver_id in driver_ids if driver_id]
+    if keys:
+        cache.delete_many(keys)
+
+
+def _version(version_key):
+    """
+    Version stamp for a group of keys.
+
+    The Django Redis backend has no delete-by-pattern, so grouped keys embed
+    this stamp and are all dropped at once by bumping it.
+    """
+    return cache.get_or_set(version_key, time_ns, timeout=None)
+
+
+def _bump_version(version_key):
+    cache.set(version_key, time_ns(), timeout=None)
+
+
+def dashboard_summary_key(from_date, to_date, include_personal, today):
+    """
+    Cache key for an admin dashboard summary.
+
+    `today` is part of the key because the monthly trend depends on the
+    current date.
+    """
+    return (
+        f'dashboard_summary:{_version(DASHBOARD_SUMMARY_VERSION_KEY)}:'
+        f'{from_date.isoformat()}:{to_date.isoformat()}:{int(include_personal)}:{today.isoformat()}'
+    )
+
+
+def invalidate_dashboard_summary():
+    """Drop every cached dashboard summary."""
+    _bump_version(DASHBOARD_SUMMARY_VERSION_KEY)
+
+
+def latest_fuel_price_key(fuel_type, station_id):
+    """
+    Cache key for the latest price lookup.
+
+    Station lookups fall back to the global snapshots, so all keys of a fuel
+    type share one version stamp.
+    """
+    version = _version(f'latest_fuel_price:version:{fuel_type}')
+    return f'latest_fuel_price:{version}:{fuel_type}:{station_id or ""}'
+
+
+def invalidate_latest_fuel_price(fuel_type):
+    """Drop cached latest prices for a fuel type."""
+    _bump_version(f'latest_fuel_price:version:{fuel_type}')
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_add_audit_log'),
+        ('fuel', '0004_fueltransactionimport'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fueltransaction',
+            index=models.Index(fields=['driver', '-purchased_at'], name='fuel_fueltr_driver__978e6a_idx'),
+        ),
+    ]
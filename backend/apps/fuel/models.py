@@ -1,5 +1,6 @@
 import uuid
 
+from django.conf import settings
 from django.db import models
 from django.db.models import Q
 
@@ -88,6 +89,7 @@ class FuelTransaction(BaseModel):
         ordering = ['-purchased_at']
         indexes = [
             models.Index(fields=['vehicle', '-purchased_at']),
+            models.Index(fields=['driver', '-purchased_at']),
             models.Index(fields=['purchased_at']),
         ]
 
@@ -95,11 +97,14 @@ class FuelTransaction(BaseModel):
         return f'{self.vehicle} - {self.purchased_at.strftime("%d/%m/%Y")} - {self.liters}L'
 
     def save(self, *args, **kwargs):
-        # Auto-calculate total_cost if not provided or if liters/unit_price changed
+        self.calculate_total_cost()
+        super().save(*args, **kwargs)
+
+    def calculate_total_cost(self):
+        """Auto-calculate total_cost if not provided or if liters/unit_price changed."""
         calculated_total = self.liters * self.unit_price
         if not self.total_cost or abs(self.total_cost - calculated_total) > 0.01:
             self.total_cost = calculated_total
-        super().save(*args, **kwargs)
 
     @property
     def km_per_liter(self):
@@ -200,3 +205,40 @@ class FuelPriceSnapshot(BaseModel):
             return snapshot.price_per_liter
 
         return None
+
+
+class ImportStatus(models.TextChoices):
+    PENDING = 'PENDING', 'Pendente'
+    PROCESSING = 'PROCESSING', 'Processando'
+    SUCCESS = 'SUCCESS', 'Concluída'
+    FAILED = 'FAILED', 'Falhou'
+
+
+class FuelTransactionImport(BaseModel):
+    """Uploaded CSV file processed in background by a Celery task."""
+    file = models.FileField('Arquivo', upload_to='imports/%Y/%m/')
+    status = models.CharField(
+        'Status',
+        max_length=20,
+        choices=ImportStatus.choices,
+        default=ImportStatus.PENDING
+    )
+    task_id = models.CharField('ID da Tarefa', max_length=255, blank=True)
+    result = models.JSONField('Resultado', null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='fuel_imports',
+        verbose_name='Enviado por'
+    )
+    finished_at = models.DateTimeField('Finalizada em', null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Importação de Abastecimentos'
+        verbose_name_plural = 'Importações de Abastecimentos'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.file.name} ({self.get_status_display()})'
@@ -11,7 +11,7 @@ from apps.core.serializers import (
 
 from apps.core.models import FuelType
 
-from .models import FuelPriceSnapshot, FuelTransaction
+from .models import FuelPriceSnapshot, FuelTransaction, FuelTransactionImport
 
 
 class FuelTransactionSerializer(serializers.ModelSerializer):
@@ -154,3 +154,19 @@ class NationalFuelPriceUpsertSerializer(serializers.Serializer):
         min_value=Decimal('0.0001')
     )
     collected_at = serializers.DateTimeField(required=False)
+
+
+class FuelTransactionImportSerializer(serializers.ModelSerializer):
+    """Status of a background CSV import."""
+    status_display = serializers.CharField(
+        source='get_status_display',
+        read_only=True
+    )
+
+    class Meta:
+        model = FuelTransactionImport
+        fields = [
+            'id', 'status', 'status_display', 'task_id', 'result',
+            'created_at', 'finished_at'
+        ]
+        read_only_fields = fields
@@ -6,19 +6,28 @@ After each FuelTransaction is created/updated:
 2. Generate consistency alerts (odometer regression, over tank capacity, etc.)
 3. Publish event to Redis for realtime updates (optional)
 4. Send email notification for critical alerts
+5. Invalidate cached dashboards (affected drivers and the admin summary)
+
+The admin summary is also invalidated when price snapshots, alerts or
+vehicles (name, plate, usage category) change.
 """
 
 import logging
 
 from django.conf import settings
 from django.core.mail import send_mail
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from apps.alerts.models import Alert, AlertSeverity, AlertType
-from apps.core.models import UsageCategory
+from apps.core.models import UsageCategory, Vehicle
 from apps.core.realtime import publish_event
 
+from .cache import (
+    invalidate_dashboard_summary,
+    invalidate_driver_dashboard,
+    invalidate_latest_fuel_price,
+)
 from .models import FuelPriceSnapshot, FuelPriceSource, FuelTransaction
 
 logger = logging.getLogger(__name__)
@@ -243,3 +252,45 @@ def publish_transaction_event(sender, instance, created, **kwargs):
         logger.debug(f"Published event to Redis: {event['type']}")
     except Exception as e:
         logger.warning(f"Could not publish to Redis: {e}")
+
+
+@receiver(pre_save, sender=FuelTransaction)
+def remember_previous_driver(sender, instance, **kwargs):
+    """Keep the stored driver so a reassignment also invalidates its dashboard."""
+    if instance._state.adding:
+        instance._previous_driver_id = None
+        return
+    instance._previous_driver_id = (
+        FuelTransaction.objects.filter(pk=instance.pk)
+        .values_list('driver_id', flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=FuelTransaction)
+@receiver(post_delete, sender=FuelTransaction)
+def invalidate_dashboard_cache(sender, instance, **kwargs):
+    """Drop cached dashboards touched by this transaction."""
+    invalidate_driver_dashboard(
+        instance.driver_id,
+        getattr(instance, '_previous_driver_id', None),
+    )
+    invalidate_dashboard_summary()
+
+
+@receiver(post_save, sender=FuelPriceSnapshot)
+@receiver(post_delete, sender=FuelPriceSnapshot)
+@receiver(post_save, sender=Alert)
+@receiver(post_delete, sender=Alert)
+@receiver(post_save, sender=Vehicle)
+@receiver(post_delete, sender=Vehicle)
+def invalidate_dashboard_summary_cache(sender, instance, **kwargs):
+    """National prices, open alerts and vehicle details are part of the admin summary."""
+    invalidate_dashboard_summary()
+
+
+@receiver(post_save, sender=FuelPriceSnapshot)
+@receiver(post_delete, sender=FuelPriceSnapshot)
+def invalidate_latest_fuel_price_cache(sender, instance, **kwargs):
+    """Drop cached latest-price lookups for the snapshot's fuel type."""
+    invalidate_latest_fuel_price(instance.fuel_type)
@@ -4,6 +4,9 @@ Celery tasks for fuel app.
 import logging
 
 from celery import shared_task
+from django.conf import settings
+from django.db import OperationalError
+from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,51 @@ def fetch_anp_prices_task(self):
         raise self.retry(exc=exc, countdown=3600)  # Retry in 1 hour
 
 
+@shared_task(bind=True, autoretry_for=(OperationalError,), retry_backoff=True, max_retries=3)
+def import_fuel_transactions_task(self, import_id):
+    """
+    Celery task to import an uploaded fuel transactions CSV.
+
+    The outcome (ImportResult.to_dict()) is stored on the FuelTransactionImport
+    row so the client can poll it through the import status endpoint.
+    """
+    from apps.fuel.models import FuelTransactionImport, ImportStatus
+    from apps.fuel.services import import_fuel_transactions
+
+    upload = FuelTransactionImport.objects.get(pk=import_id)
+    upload.status = ImportStatus.PROCESSING
+    upload.save(update_fields=['status', 'updated_at'])
+
+    try:
+        with upload.file.open('rb') as fh:
+            result = import_fuel_transactions(fh, workers=settings.CSV_IMPORT_WORKERS)
+    except OperationalError as exc:
+        if self.request.retries < self.max_retries:
+            # Transient DB failure: let autoretry handle it
+            raise
+        # Out of retries: don't leave the row PROCESSING for the client to poll forever
+        logger.error(f"Fuel transactions import {import_id} failed after {self.max_retries} retries: {exc}")
+        upload.status = ImportStatus.FAILED
+        upload.result = {'error': 'Erro de banco de dados ao processar arquivo. Tente novamente.'}
+    except Exception as exc:
+        logger.error(f"Fuel transactions import {import_id} failed: {exc}")
+        upload.status = ImportStatus.FAILED
+        upload.result = {'error': f'Erro ao processar arquivo: {exc}'}
+    else:
+        upload.status = ImportStatus.SUCCESS if result.success else ImportStatus.FAILED
+        upload.result = result.to_dict()
+        logger.info(
+            f"Fuel transactions import {import_id} finished: "
+            f"{result.imported_count} imported, {result.error_count} errors"
+        )
+
+    # Only the report is kept once processing ends
+    upload.file.delete(save=False)
+    upload.finished_at = timezone.now()
+    upload.save(update_fields=['status', 'result', 'file', 'finished_at', 'updated_at'])
+    return upload.status
+
+
 @shared_task
 def test_celery_task():
     """Simple test task to verify Celery is working."""
@@ -0,0 +1,294 @@
+import json
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.fuel.models import (
+    FuelPriceSnapshot,
+    FuelPriceSource,
+    FuelTransaction,
+    FuelTransactionImport,
+    ImportStatus,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def _csv_file(vehicle):
+    content = (
+        "data;placa;litros;preco_litro;total;odometro;combustivel\n"
+        f"15/01/2025 08:30;{vehicle.plate};40,0;5,00;;10000;DIESEL\n"
+        f"20/01/2025 08:30;{vehicle.plate};30,0;5,00;;10400;DIESEL\n"
+    )
+    return SimpleUploadedFile("abastecimentos.csv", content.encode("utf-8"), content_type="text/csv")
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+def test_import_is_queued_and_status_can_be_polled(admin_api_client, vehicle_operational):
+    response = admin_api_client.post(
+        "/api/import/transactions/",
+        {"file": _csv_file(vehicle_operational)},
+        format="multipart",
+    )
+
+    assert response.status_code == 202
+    upload = FuelTransactionImport.objects.get(pk=response.data["id"])
+    assert upload.status == ImportStatus.SUCCESS
+
+    status_response = admin_api_client.get(f"/api/import/transactions/{upload.id}/")
+    assert status_response.status_code == 200
+    assert status_response.data["status"] == ImportStatus.SUCCESS
+    assert status_response.data["result"]["summary"]["imported"] == 2
+    assert FuelTransaction.objects.filter(vehicle=vehicle_operational).count() == 2
+
+
+def test_import_answers_queued_state_and_deletes_the_file_when_done(
+    admin_api_client, vehicle_operational, tmp_path
+):
+    response = admin_api_client.post(
+        "/api/import/transactions/",
+        {"file": _csv_file(vehicle_operational)},
+        format="multipart",
+    )
+
+    assert response.status_code == 202
+    assert response.data["status"] == ImportStatus.PENDING
+    assert response.data["task_id"]
+    upload = FuelTransactionImport.objects.get(pk=response.data["id"])
+    assert upload.status == ImportStatus.SUCCESS
+    assert not upload.file
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+def test_sync_import_returns_report(admin_api_client, vehicle_operational):
+    response = admin_api_client.post(
+        "/api/import/transactions/?sync=1",
+        {"file": _csv_file(vehicle_operational)},
+        format="multipart",
+    )
+
+    assert response.status_code == 200
+    assert response.data["summary"]["imported"] == 2
+    assert not FuelTransactionImport.objects.exists()
+
+
+def test_sync_import_falls_back_to_latin1(admin_api_client, vehicle_operational):
+    content = (
+        "data;placa;litros;preco_litro;odometro;observacoes\n"
+        f"15/01/2025 08:30;{vehicle_operational.plate};40,0;5,00;10000;Manutenção\n"
+    )
+    upload = SimpleUploadedFile("latin1.csv", content.encode("latin-1"), content_type="text/csv")
+
+    response = admin_api_client.post(
+        "/api/import/transactions/?sync=1", {"file": upload}, format="multipart"
+    )
+
+    assert response.status_code == 200
+    assert FuelTransaction.objects.get(vehicle=vehicle_operational).notes == "Manutenção"
+
+
+def test_reimport_skips_duplicates_and_updates_snapshot(admin_api_client, vehicle_operational):
+    first = admin_api_client.post(
+        "/api/import/transactions/?sync=1",
+        {"file": _csv_file(vehicle_operational)},
+        format="multipart",
+    )
+    assert first.data["summary"]["imported"] == 2
+    assert FuelPriceSnapshot.objects.filter(
+        fuel_type=vehicle_operational.fuel_type,
+        station__isnull=True,
+        source=FuelPriceSource.LAST_TRANSACTION,
+    ).exists()
+
+    second = admin_api_client.post(
+        "/api/import/transactions/?sync=1",
+        {"file": _csv_file(vehicle_operational)},
+        format="multipart",
+    )
+    assert second.data["summary"]["imported"] == 0
+    assert second.data["summary"]["skipped"] == 2
+    assert FuelTransaction.objects.filter(vehicle=vehicle_operational).count() == 2
+
+
+def test_duplicate_rows_in_same_file_are_skipped(admin_api_client, vehicle_operational):
+    content = (
+        "data;placa;litros;preco_litro;odometro\n"
+        f"15/01/2025 08:30;{vehicle_operational.plate};40,0;5,00;10000\n"
+        f"15/01/2025 08:30;{vehicle_operational.plate};40,0;5,00;10000\n"
+    )
+    upload = SimpleUploadedFile("dup.csv", content.encode("utf-8"), content_type="text/csv")
+
+    response = admin_api_client.post(
+        "/api/import/transactions/?sync=1", {"file": upload}, format="multipart"
+    )
+
+    assert response.data["summary"]["imported"] == 1
+    assert response.data["summary"]["skipped"] == 1
+
+
+def test_oversized_upload_is_rejected(admin_api_client):
+    upload = SimpleUploadedFile(
+        "grande.csv", b"0" * (10 * 1024 * 1024 + 1), content_type="text/csv"
+    )
+
+    response = admin_api_client.post("/api/import/transactions/", {"file": upload}, format="multipart")
+
+    assert response.status_code == 400
+    assert "10MB" in response.data["error"]
+    assert not FuelTransactionImport.objects.exists()
+
+
+def test_upload_of_exactly_the_size_limit_is_accepted(admin_api_client, vehicle_operational):
+    # The limit applies to the file, not to the multipart framing around it
+    header = "data;placa;litros;preco_litro;odometro;observacoes\n"
+    rows = [
+        f"{1 + i // 24:02d}/01/2025 {i % 24:02d}:00;{vehicle_operational.plate};40,0;5,00;{10000 + i * 100};"
+        for i in range(100)
+    ]
+    free = 10 * 1024 * 1024 - len(header) - sum(len(row) + 1 for row in rows)
+    notes = [free // 100] * 99 + [free - (free // 100) * 99]
+    content = header + "".join(f"{row}{'x' * n}\n" for row, n in zip(rows, notes))
+    upload = SimpleUploadedFile("limite.csv", content.encode("utf-8"), content_type="text/csv")
+    assert upload.size == 10 * 1024 * 1024
+
+    response = admin_api_client.post(
+        "/api/import/transactions/?sync=1", {"file": upload}, format="multipart"
+    )
+
+    assert response.status_code == 200
+    assert response.data["summary"]["imported"] == 100
+
+
+def test_non_csv_content_type_is_rejected(admin_api_client, vehicle_operational):
+    upload = SimpleUploadedFile(
+        "abastecimentos.csv", b"data;placa\n", content_type="application/pdf"
+    )
+
+    response = admin_api_client.post("/api/import/transactions/", {"file": upload}, format="multipart")
+
+    assert response.status_code == 400
+    assert not FuelTransactionImport.objects.exists()
+
+
+@pytest.mark.parametrize("content_type", ["application/octet-stream", ""])
+def test_unlabeled_csv_upload_is_accepted(admin_api_client, vehicle_operational, content_type):
+    # curl -F sends octet-stream; requests' files= sends no part Content-Type
+    upload = _csv_file(vehicle_operational)
+    upload.content_type = content_type
+
+    response = admin_api_client.post(
+        "/api/import/transactions/?sync=1", {"file": upload}, format="multipart"
+    )
+
+    assert response.status_code == 200
+    assert response.data["summary"]["imported"] == 2
+
+
+@pytest.mark.parametrize("url", ["/api/import/transactions/template/", "/api/import/transactions/format/"])
+def test_template_and_format_support_conditional_requests(admin_api_client, url):
+    response = admin_api_client.get(url)
+    assert response.status_code == 200
+    assert response["ETag"]
+
+    cached = admin_api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert cached.status_code == 304
+
+
+def test_template_still_requires_admin(driver_api_client):
+    response = driver_api_client.get("/api/import/transactions/template/")
+    assert response.status_code == 403
+
+
+def test_parallel_parsing_matches_serial(monkeypatch, vehicle_operational):
+    from apps.fuel.services import csv_importer
+
+    monkeypatch.setattr(csv_importer, "PARSE_CHUNK_SIZE", 2)
+    content = (
+        "data;placa;litros;preco_litro;odometro\n"
+        f"15/01/2025 08:30;{vehicle_operational.plate};40,0;5,00;10000\n"
+        "data-invalida;XXX-0000;40,0;5,00;10100\n"
+        f"17/01/2025 08:30;{vehicle_operational.plate};35,0;5,00;10200\n"
+        f"18/01/2025 08:30;{vehicle_operational.plate};-1;5,00;10300\n"
+        f"19/01/2025 08:30;{vehicle_operational.plate};30,0;5,00;10400\n"
+    ).encode("utf-8")
+
+    serial = csv_importer.import_fuel_transactions(content).to_dict()
+    parallel = csv_importer.import_fuel_transactions(content, workers=2).to_dict()
+
+    assert parallel == serial
+    assert [(e["row"], e["column"]) for e in parallel["errors"]] == [
+        (3, "data"), (3, "placa"), (5, "litros"),
+    ]
+
+
+def test_parallel_parsing_falls_back_inline_in_daemonic_workers(monkeypatch, vehicle_operational):
+    from types import SimpleNamespace
+
+    from apps.fuel.services import csv_importer
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("daemonic processes cannot start a process pool")
+
+    monkeypatch.setattr(csv_importer, "PARSE_CHUNK_SIZE", 2)
+    monkeypatch.setattr(csv_importer, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(
+        csv_importer.multiprocessing, "current_process", lambda: SimpleNamespace(daemon=True)
+    )
+    content = (
+        "data;placa;litros;preco_litro;odometro\n"
+        f"15/01/2025 08:30;{vehicle_operational.plate};40,0;5,00;10000\n"
+        f"17/01/2025 08:30;{vehicle_operational.plate};35,0;5,00;10200\n"
+        f"19/01/2025 08:30;{vehicle_operational.plate};30,0;5,00;10400\n"
+    ).encode("utf-8")
+
+    result = csv_importer.import_fuel_transactions(content, workers=2)
+
+    assert result.imported_count == 3
+
+
+def test_import_is_marked_failed_when_db_retries_are_exhausted(monkeypatch, vehicle_operational):
+    from django.db import OperationalError
+
+    from apps.fuel import services
+    from apps.fuel.tasks import import_fuel_transactions_task
+
+    def broken_import(*args, **kwargs):
+        raise OperationalError("database is locked")
+
+    monkeypatch.setattr(services, "import_fuel_transactions", broken_import)
+    upload = FuelTransactionImport.objects.create(file=_csv_file(vehicle_operational))
+
+    import_fuel_transactions_task.apply(
+        args=[upload.id], retries=import_fuel_transactions_task.max_retries
+    )
+
+    upload.refresh_from_db()
+    assert upload.status == ImportStatus.FAILED
+    assert upload.finished_at is not None
+    assert "banco de dados" in upload.result["error"]
+
+
+def test_sync_import_streams_large_error_reports_as_ndjson(admin_api_client, vehicle_operational):
+    rows = "".join(
+        f"data-invalida;{vehicle_operational.plate};40,0;5,00;10000\n" for _ in range(100)
+    )
+    upload = SimpleUploadedFile(
+        "erros.csv", ("data;placa;litros;preco_litro;odometro\n" + rows).encode("utf-8"),
+        content_type="text/csv",
+    )
+
+    response = admin_api_client.post(
+        "/api/import/transactions/?sync=1", {"file": upload}, format="multipart"
+    )
+
+    assert response.status_code == 400
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+    assert lines[0]["success"] is False
+    assert lines[0]["summary"]["errors"] == 100
+    assert len(lines) == 101
+    assert lines[1]["row"] == 2 and lines[1]["column"] == "data"
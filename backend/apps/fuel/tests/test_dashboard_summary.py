@@ -74,3 +74,97 @@ def test_dashboard_summary_filters_personal(admin_api_client, vehicle_operationa
         f"/api/dashboard/summary/?from={from_date}&to={to_date}&include_personal=1"
     )
     assert Decimal(str(response_all.data["summary"]["total_cost"])) == Decimal("65.00")
+
+
+def test_dashboard_summary_km_per_liter_uses_first_and_last_purchase(admin_api_client, vehicle_operational):
+    timestamp = timezone.now()
+    # Odometer readings: 1000 -> 1400 -> 1300 (typo on the last one).
+    # km traveled is last - first, not max - min.
+    for days_ago, odometer in [(3, 1000), (2, 1400), (1, 1300)]:
+        FuelTransaction.objects.create(
+            vehicle=vehicle_operational,
+            purchased_at=timestamp - timezone.timedelta(days=days_ago),
+            liters=Decimal("10.000"),
+            unit_price=Decimal("5.0000"),
+            total_cost=Decimal("50.00"),
+            odometer_km=odometer,
+            fuel_type=vehicle_operational.fuel_type,
+        )
+
+    from_date = (timestamp - timezone.timedelta(days=5)).date().isoformat()
+    to_date = (timestamp + timezone.timedelta(days=1)).date().isoformat()
+    response = admin_api_client.get(f"/api/dashboard/summary/?from={from_date}&to={to_date}")
+
+    assert response.status_code == 200
+    item = response.data["cost_by_vehicle"][0]
+    assert item["km_per_liter"] == 10.0
+    assert item["cost_per_km"] == 0.5
+
+
+def test_dashboard_summary_cache_invalidated_on_new_transaction(admin_api_client, vehicle_operational):
+    timestamp = timezone.now()
+    from_date = (timestamp - timezone.timedelta(days=1)).date().isoformat()
+    to_date = (timestamp + timezone.timedelta(days=1)).date().isoformat()
+    url = f"/api/dashboard/summary/?from={from_date}&to={to_date}"
+
+    first = admin_api_client.get(url)
+    assert first.data["summary"]["transaction_count"] == 0
+
+    FuelTransaction.objects.create(
+        vehicle=vehicle_operational,
+        purchased_at=timestamp,
+        liters=Decimal("10.000"),
+        unit_price=Decimal("4.0000"),
+        total_cost=Decimal("40.00"),
+        odometer_km=1200,
+        fuel_type=vehicle_operational.fuel_type,
+    )
+
+    second = admin_api_client.get(url)
+    assert second.data["summary"]["transaction_count"] == 1
+
+
+def test_dashboard_summary_cache_invalidated_on_vehicle_change(admin_api_client, vehicle_operational):
+    timestamp = timezone.now()
+    FuelTransaction.objects.create(
+        vehicle=vehicle_operational,
+        purchased_at=timestamp,
+        liters=Decimal("10.000"),
+        unit_price=Decimal("4.0000"),
+        total_cost=Decimal("40.00"),
+        odometer_km=1200,
+        fuel_type=vehicle_operational.fuel_type,
+    )
+    from_date = (timestamp - timezone.timedelta(days=1)).date().isoformat()
+    to_date = (timestamp + timezone.timedelta(days=1)).date().isoformat()
+    url = f"/api/dashboard/summary/?from={from_date}&to={to_date}"
+
+    first = admin_api_client.get(url)
+    assert first.data["cost_by_vehicle"][0]["vehicle__name"] == vehicle_operational.name
+
+    vehicle_operational.name = "Hilux Renomeada"
+    vehicle_operational.save()
+
+    second = admin_api_client.get(url)
+    assert second.data["cost_by_vehicle"][0]["vehicle__name"] == "Hilux Renomeada"
+
+
+def test_dashboard_summary_uses_latest_national_snapshot(admin_api_client, vehicle_operational):
+    timestamp = timezone.now()
+    for days_ago, price, source in [
+        (5, "5.0000", FuelPriceSource.MANUAL),
+        (1, "6.0000", FuelPriceSource.EXTERNAL_ANP),
+    ]:
+        FuelPriceSnapshot.objects.create(
+            fuel_type=vehicle_operational.fuel_type,
+            station=None,
+            price_per_liter=Decimal(price),
+            collected_at=timestamp - timezone.timedelta(days=days_ago),
+            source=source,
+        )
+
+    response = admin_api_client.get("/api/dashboard/summary/")
+
+    prices = {p["fuel_type"]: p for p in response.data["price_reference"]["national_avg_prices"]}
+    assert prices[vehicle_operational.fuel_type]["price_per_liter"] == Decimal("6.0000")
+    assert prices[vehicle_operational.fuel_type]["source"] == FuelPriceSource.EXTERNAL_ANP
@@ -37,3 +37,47 @@ def test_driver_dashboard_returns_stats(driver_api_client, driver):
     assert response.data["stats"]["transaction_count"] == 2
     assert Decimal(str(response.data["stats"]["total_liters"])) == Decimal("20.000")
     assert Decimal(str(response.data["stats"]["total_cost"])) == Decimal("100.00")
+    assert response.data["stats"]["avg_km_per_liter"] == 7.5
+
+
+def test_driver_dashboard_cache_invalidated_on_new_transaction(driver_api_client, driver):
+    first = driver_api_client.get("/api/dashboard/driver/")
+    assert first.status_code == 200
+    assert first.data["stats"]["transaction_count"] == 0
+
+    FuelTransaction.objects.create(
+        vehicle=driver.current_vehicle,
+        driver=driver,
+        purchased_at=timezone.now(),
+        liters=Decimal("10.000"),
+        unit_price=Decimal("5.0000"),
+        total_cost=Decimal("0.00"),
+        odometer_km=2000,
+        fuel_type=driver.current_vehicle.fuel_type,
+    )
+
+    second = driver_api_client.get("/api/dashboard/driver/")
+    assert second.status_code == 200
+    assert second.data["stats"]["transaction_count"] == 1
+
+
+def test_driver_dashboard_recent_transactions_keep_numeric_wire_format(driver_api_client, driver):
+    FuelTransaction.objects.create(
+        vehicle=driver.current_vehicle,
+        driver=driver,
+        purchased_at=timezone.now(),
+        liters=Decimal("8.000"),
+        unit_price=Decimal("5.0000"),
+        total_cost=Decimal("40.00"),
+        odometer_km=1000,
+        fuel_type=driver.current_vehicle.fuel_type,
+    )
+
+    body = driver_api_client.get("/api/dashboard/driver/").json()
+
+    recent = body["recent_transactions"][0]
+    # Same encoding as the stats block: numbers, and DRF's datetime format
+    assert recent["liters"] == 8.0
+    assert recent["total_cost"] == 40.0
+    assert recent["purchased_at"].endswith("Z")
+    assert body["stats"]["total_cost"] == 40.0
@@ -48,3 +48,51 @@ def test_latest_fuel_price_returns_last_transaction_snapshot(admin_api_client, v
     assert response.status_code == 200
     assert Decimal(str(response.data["price_per_liter"])) == Decimal("6.1000")
     assert response.data["source"] == FuelPriceSource.LAST_TRANSACTION
+
+
+def test_fetch_anp_is_queued_and_status_can_be_polled(admin_api_client, monkeypatch):
+    anp_result = {
+        "success": True,
+        "prices_updated": [{"fuel_type": "DIESEL", "price": "6.1000", "action": "created"}],
+        "errors": [],
+        "source_url": "https://example.test/anp.xlsx",
+    }
+    monkeypatch.setattr("apps.fuel.services.fetch_and_save_anp_prices", lambda: anp_result)
+
+    response = admin_api_client.post("/api/fuel-prices/fetch-anp/")
+
+    assert response.status_code == 202
+    task_id = response.data["task_id"]
+
+    status_response = admin_api_client.get(f"/api/fuel-prices/fetch-anp/{task_id}/")
+    assert status_response.status_code == 200
+    assert status_response.data["status"] == "SUCCESS"
+    assert status_response.data["result"] == anp_result
+    assert status_response.data["error"] is None
+
+
+def test_latest_fuel_price_for_station_is_refreshed_after_new_transaction(
+    admin_api_client, vehicle_operational, fuel_station
+):
+    def buy(unit_price, odometer_km):
+        payload = {
+            "vehicle": str(vehicle_operational.id),
+            "station": str(fuel_station.id),
+            "purchased_at": timezone.now().isoformat(),
+            "liters": "10.000",
+            "unit_price": unit_price,
+            "odometer_km": odometer_km,
+            "fuel_type": vehicle_operational.fuel_type,
+        }
+        assert admin_api_client.post("/api/fuel-transactions/", payload, format="json").status_code == 201
+
+    url = f"/api/fuel-prices/latest/?fuel_type={vehicle_operational.fuel_type}&station_id={fuel_station.id}"
+
+    buy("6.1000", 1000)
+    first = admin_api_client.get(url)
+    assert Decimal(str(first.data["price_per_liter"])) == Decimal("6.1000")
+    assert first.data["station_name"] == fuel_station.name
+
+    buy("6.3000", 1100)
+    second = admin_api_client.get(url)
+    assert Decimal(str(second.data["price_per_liter"])) == Decimal("6.3000")
@@ -3,7 +3,7 @@ from decimal import Decimal
 import pytest
 from django.utils import timezone
 
-from apps.fuel.models import FuelPriceSnapshot
+from apps.fuel.models import FuelPriceSnapshot, FuelTransaction
 
 pytestmark = pytest.mark.django_db
 
@@ -85,3 +85,26 @@ def test_driver_cannot_update_transaction(driver_api_client, admin_api_client, v
     )
 
     assert response.status_code == 403
+
+
+def test_export_streams_csv(admin_api_client, vehicle_operational):
+    timestamp = timezone.now()
+    FuelTransaction.objects.create(
+        vehicle=vehicle_operational,
+        purchased_at=timestamp,
+        liters=Decimal("10.000"),
+        unit_price=Decimal("5.0000"),
+        total_cost=Decimal("50.00"),
+        odometer_km=1500,
+        fuel_type=vehicle_operational.fuel_type,
+    )
+
+    day = timezone.localdate().isoformat()
+    response = admin_api_client.get(f"/api/reports/transactions/export/?from={day}&to={day}")
+
+    assert response.status_code == 200
+    assert response.streaming
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert lines[0].startswith("Data/Hora,Veiculo,Placa")
+    assert len(lines) == 2
+    assert vehicle_operational.plate in lines[1]
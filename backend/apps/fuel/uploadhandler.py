@@ -0,0 +1,59 @@
+"""
+Upload handlers for the fuel CSV import.
+
+Django buffers uploads larger than FILE_UPLOAD_MAX_MEMORY_SIZE to a temporary
+file before the view sees them. CSVUploadHandler keeps imports in memory and
+refuses oversized bodies up front, so rejected files never touch the disk.
+"""
+from django.core.files.uploadhandler import MemoryFileUploadHandler, StopUpload
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+CSV_IMPORT_MAX_BYTES = 10 * 1024 * 1024  # 10MB
+# Content-Length covers the whole multipart body: boundaries, part headers
+# and any other form fields on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 8 * 1024
+
+CSV_CONTENT_TYPES = frozenset({
+    'text/csv',
+    'application/csv',
+    'application/vnd.ms-excel',  # Windows browsers report .csv like this
+    'text/plain',
+})
+
+# Sent by clients that don't label the part (curl -F, requests' files=).
+# Accepted for .csv names; the parser then validates the content.
+GENERIC_CONTENT_TYPES = frozenset({'', 'application/octet-stream'})
+
+
+class CSVUploadHandler(MemoryFileUploadHandler):
+    """
+    In-memory upload handler capped at `max_bytes`.
+
+    Requests whose Content-Length exceeds the cap (plus the multipart
+    framing allowance) are not parsed at all; otherwise the file is cut off
+    once the received data crosses the cap. Either way `too_large` is set
+    for the view.
+    """
+
+    def __init__(self, request=None, max_bytes=CSV_IMPORT_MAX_BYTES):
+        super().__init__(request)
+        self.max_bytes = max_bytes
+        self.too_large = False
+        self._received = 0
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if content_length > self.max_bytes + MULTIPART_OVERHEAD_BYTES:
+            self.too_large = True
+            # Short-circuit parsing: no POST data, no files
+            return QueryDict(encoding=encoding), MultiValueDict()
+        # Always keep the file in memory; the cap above bounds its size
+        self.activated = True
+        return None
+
+    def receive_data_chunk(self, raw_data, start):
+        self._received += len(raw_data)
+        if self._received > self.max_bytes:
+            self.too_large = True
+            raise StopUpload(connection_reset=True)
+        return super().receive_data_chunk(raw_data, start)
@@ -4,11 +4,13 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     DashboardSummaryView,
     DriverDashboardView,
+    FetchANPPricesStatusView,
     FetchANPPricesView,
     FuelPriceSnapshotViewSet,
     FuelTransactionViewSet,
     FuelTransactionsExportView,
     FuelTransactionsImportFormatView,
+    FuelTransactionsImportStatusView,
     FuelTransactionsImportTemplateView,
     FuelTransactionsImportView,
     LatestFuelPriceView,
@@ -23,11 +25,13 @@ urlpatterns = [
     path('fuel-prices/latest/', LatestFuelPriceView.as_view(), name='latest-fuel-price'),
     path('fuel-prices/national/', NationalFuelPriceView.as_view(), name='national-fuel-price'),
     path('fuel-prices/fetch-anp/', FetchANPPricesView.as_view(), name='fetch-anp-prices'),
+    path('fuel-prices/fetch-anp/<str:task_id>/', FetchANPPricesStatusView.as_view(), name='fetch-anp-prices-status'),
     path('dashboard/summary/', DashboardSummaryView.as_view(), name='dashboard-summary'),
     path('dashboard/driver/', DriverDashboardView.as_view(), name='driver-dashboard'),
     path('reports/transactions/export/', FuelTransactionsExportView.as_view(), name='fuel-transactions-export'),
     path('import/transactions/', FuelTransactionsImportView.as_view(), name='fuel-transactions-import'),
     path('import/transactions/template/', FuelTransactionsImportTemplateView.as_view(), name='fuel-transactions-import-template'),
     path('import/transactions/format/', FuelTransactionsImportFormatView.as_view(), name='fuel-transactions-import-format'),
+    path('import/transactions/<uuid:pk>/', FuelTransactionsImportStatusView.as_view(), name='fuel-transactions-import-status'),
     path('', include(router.urls)),
 ]
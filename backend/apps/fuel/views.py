@@ -1,13 +1,20 @@
 import csv
-from datetime import timedelta
+import hashlib
+import json
 from decimal import Decimal
 
-from django.db.models import Count, Sum
-from django.db.models.functions import TruncMonth
+from dateutil.relativedelta import relativedelta
+from django.core.cache import cache
+from django.db.models import Count, F, RowRange, Sum, Window
+from django.db.models.functions import FirstValue, LastValue, RowNumber, TruncMonth
 from django.utils import timezone
 from django.utils.dateparse import parse_date
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 from django_filters import rest_framework as filters
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -29,10 +36,22 @@ from apps.core.audit import AuditAction, AuditMixin, model_to_dict
 from apps.core.models import FuelType, UsageCategory
 from apps.users.permissions import IsAdminOrDriver, IsAdminUser, IsDriver
 
-from .models import FuelPriceSnapshot, FuelPriceSource, FuelTransaction
+from .cache import (
+    DASHBOARD_SUMMARY_TTL,
+    DRIVER_DASHBOARD_TTL,
+    LATEST_FUEL_PRICE_TTL,
+    dashboard_summary_key,
+    driver_dashboard_key,
+    driver_dashboard_since,
+    latest_fuel_price_key,
+    local_day_start,
+    local_days_filter,
+)
+from .models import FuelPriceSnapshot, FuelPriceSource, FuelTransaction, FuelTransactionImport
 from .serializers import (
     FuelPriceSnapshotSerializer,
     FuelTransactionCreateSerializer,
+    FuelTransactionImportSerializer,
     FuelTransactionListSerializer,
     FuelTransactionSerializer,
     NationalFuelPriceUpsertSerializer,
@@ -42,6 +61,17 @@ from .services import (
     get_csv_format_specification,
     import_fuel_transactions,
 )
+from .services.csv_importer import NDJSON_MIN_ERRORS
+from .tasks import fetch_anp_prices_task, import_fuel_transactions_task
+from .uploadhandler import (
+    CSV_CONTENT_TYPES,
+    CSV_IMPORT_MAX_BYTES,
+    GENERIC_CONTENT_TYPES,
+    CSVUploadHandler,
+)
+
+# FuelType choices never change at runtime
+ALL_FUEL_TYPES = tuple(FuelType.values)
 
 
 class FuelTransactionFilter(filters.FilterSet):
@@ -248,46 +278,50 @@ class LatestFuelPriceView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Polled by the transaction form: cache briefly, snapshot signals invalidate it
+        data = cache.get_or_set(
+            latest_fuel_price_key(fuel_type, station_id),
+            lambda: self._latest_price(fuel_type, station_id),
+            timeout=LATEST_FUEL_PRICE_TTL,
+        )
+        if data is None:
+            return Response(
+                {'error': 'No fuel price found for this fuel type'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(data)
+
+    def _latest_price(self, fuel_type, station_id):
+        snapshots = FuelPriceSnapshot.objects.select_related('station').only(
+            'fuel_type', 'price_per_liter', 'collected_at', 'source', 'station_id', 'station__name',
+        ).filter(fuel_type=fuel_type)
+
+        snapshot = None
         # Try specific station first (pump price reference)
         if station_id:
-            snapshot = FuelPriceSnapshot.objects.filter(
-                fuel_type=fuel_type,
+            snapshot = snapshots.filter(
                 station_id=station_id,
                 source=FuelPriceSource.LAST_TRANSACTION,
             ).first()
-            if snapshot:
-                data = {
-                    'fuel_type': snapshot.fuel_type,
-                    'price_per_liter': snapshot.price_per_liter,
-                    'collected_at': snapshot.collected_at,
-                    'source': snapshot.source,
-                    'station_id': snapshot.station_id,
-                    'station_name': snapshot.station.name if snapshot.station else None,
-                }
-                return Response(data)
 
         # Prefer last transaction (global)
-        snapshot = FuelPriceSnapshot.objects.filter(
-            fuel_type=fuel_type,
-            station__isnull=True,
-            source=FuelPriceSource.LAST_TRANSACTION,
-        ).first()
+        if not snapshot:
+            snapshot = snapshots.filter(
+                station__isnull=True,
+                source=FuelPriceSource.LAST_TRANSACTION,
+            ).first()
 
         # Fall back to national average (external/manual)
         if not snapshot:
-            snapshot = FuelPriceSnapshot.objects.filter(
-                fuel_type=fuel_type,
+            snapshot = snapshots.filter(
                 station__isnull=True,
                 source__in=[FuelPriceSource.EXTERNAL_ANP, FuelPriceSource.MANUAL],
             ).order_by('-collected_at').first()
 
         if not snapshot:
-            return Response(
-                {'error': 'No fuel price found for this fuel type'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+            return None
 
-        data = {
+        return {
             'fuel_type': snapshot.fuel_type,
             'price_per_liter': snapshot.price_per_liter,
             'collected_at': snapshot.collected_at,
@@ -295,7 +329,6 @@ class LatestFuelPriceView(APIView):
             'station_id': snapshot.station_id,
             'station_name': snapshot.station.name if snapshot.station else None,
         }
-        return Response(data)
 
 
 class NationalFuelPriceView(APIView):
@@ -330,6 +363,33 @@ class NationalFuelPriceView(APIView):
         return Response(FuelPriceSnapshotSerializer(snapshot).data, status=status.HTTP_200_OK)
 
 
+def _odometer_span_by_vehicle(transactions):
+    """
+    Map vehicle_id -> (km_traveled, liters) for vehicles with 2+ transactions.
+
+    km_traveled is the odometer of the latest purchase minus the earliest one,
+    computed with window functions in a single query instead of one
+    first()/last() pair per vehicle.
+    """
+    by_vehicle = {
+        'partition_by': [F('vehicle_id')],
+        'order_by': F('purchased_at').asc(),
+        'frame': RowRange(start=None, end=None),
+    }
+    rows = transactions.order_by().annotate(
+        first_odo=Window(FirstValue('odometer_km'), **by_vehicle),
+        last_odo=Window(LastValue('odometer_km'), **by_vehicle),
+        liters_sum=Window(Sum('liters'), partition_by=[F('vehicle_id')]),
+        n=Window(Count('id'), partition_by=[F('vehicle_id')]),
+    ).values_list('vehicle_id', 'first_odo', 'last_odo', 'liters_sum', 'n').distinct()
+
+    return {
+        vehicle_id: (last_odo - first_odo, liters_sum)
+        for vehicle_id, first_odo, last_odo, liters_sum, n in rows
+        if n >= 2
+    }
+
+
 class DashboardSummaryView(APIView):
     """Dashboard summary with costs, consumption and alerts."""
     permission_classes = [IsAdminUser]
@@ -415,10 +475,18 @@ Retorna métricas consolidadas do período:
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Cached for a short TTL; transaction, price and alert signals invalidate it
+        data = cache.get_or_set(
+            dashboard_summary_key(from_date, to_date, include_personal, timezone.localdate()),
+            lambda: self._build_payload(from_date, to_date, include_personal),
+            timeout=DASHBOARD_SUMMARY_TTL,
+        )
+        return Response(data)
+
+    def _build_payload(self, from_date, to_date, include_personal):
         # Base queryset
         transactions = FuelTransaction.objects.filter(
-            purchased_at__date__gte=from_date,
-            purchased_at__date__lte=to_date
+            **local_days_filter(from_date, to_date)
         )
 
         # Filter out personal vehicles if needed
@@ -427,14 +495,14 @@ Retorna métricas consolidadas do período:
                 vehicle__usage_category=UsageCategory.PERSONAL
             )
 
-        # Total cost for period
-        total_cost = transactions.aggregate(
-            total=Sum('total_cost')
-        )['total'] or Decimal('0.00')
-
-        total_liters = transactions.aggregate(
-            total=Sum('liters')
-        )['total'] or Decimal('0.00')
+        # Totals for period (single scan)
+        totals = transactions.aggregate(
+            total_cost=Sum('total_cost'),
+            total_liters=Sum('liters'),
+            transaction_count=Count('id'),
+        )
+        total_cost = totals['total_cost'] or Decimal('0.00')
+        total_liters = totals['total_liters'] or Decimal('0.00')
 
         # Cost by vehicle
         cost_by_vehicle = list(
@@ -473,37 +541,27 @@ Retorna métricas consolidadas do período:
                 'transaction_count': without_cost_center['transaction_count'],
             })
 
-        # Calculate km/L and cost/km for each vehicle
+        # Calculate km/L and cost/km for each vehicle. Only vehicles with 2+
+        # transactions (known from the grouped rows above) need the odometer query.
+        multi_tx_vehicles = [
+            item['vehicle__id'] for item in cost_by_vehicle if item['transaction_count'] >= 2
+        ]
+        odometer_spans = _odometer_span_by_vehicle(
+            transactions.filter(vehicle_id__in=multi_tx_vehicles)
+        ) if multi_tx_vehicles else {}
         for item in cost_by_vehicle:
-            vehicle_id = item['vehicle__id']
-            vehicle_txs = transactions.filter(vehicle_id=vehicle_id).order_by('purchased_at')
-
-            if vehicle_txs.count() >= 2:
-                first_tx = vehicle_txs.first()
-                last_tx = vehicle_txs.last()
-                km_traveled = last_tx.odometer_km - first_tx.odometer_km
-                total_liters_vehicle = item['total_liters']
-
-                if total_liters_vehicle > 0 and km_traveled > 0:
-                    item['km_per_liter'] = round(km_traveled / float(total_liters_vehicle), 2)
-                    item['cost_per_km'] = round(float(item['total_cost']) / km_traveled, 2)
-                else:
-                    item['km_per_liter'] = None
-                    item['cost_per_km'] = None
-            else:
-                item['km_per_liter'] = None
-                item['cost_per_km'] = None
+            km_traveled = odometer_spans.get(item['vehicle__id'], (0, None))[0]
+            total_liters_vehicle = float(item['total_liters'] or 0)
+            has_span = km_traveled > 0 and total_liters_vehicle > 0
+            item['km_per_liter'] = round(km_traveled / total_liters_vehicle, 2) if has_span else None
+            item['cost_per_km'] = round(float(item['total_cost']) / km_traveled, 2) if has_span else None
 
         # Monthly trend (last 6 months)
-        six_months_ago = timezone.now().date().replace(day=1)
-        for _ in range(5):
-            month = six_months_ago.month - 1 or 12
-            year = six_months_ago.year if month != 12 else six_months_ago.year - 1
-            six_months_ago = six_months_ago.replace(year=year, month=month, day=1)
+        six_months_ago = timezone.localdate().replace(day=1) - relativedelta(months=5)
 
         monthly_trend = list(
             FuelTransaction.objects.filter(
-                purchased_at__date__gte=six_months_ago
+                purchased_at__gte=local_day_start(six_months_ago)
             ).exclude(
                 vehicle__usage_category=UsageCategory.PERSONAL
             ).annotate(
@@ -515,33 +573,40 @@ Retorna métricas consolidadas do período:
         )
 
         # National average reference (manual/external) vs actual cost
-        all_fuel_types = [choice[0] for choice in FuelType.choices]
-        fuel_types = list(transactions.values_list('fuel_type', flat=True).distinct())
+        # Latest snapshot per fuel type only (window filter, portable DISTINCT ON)
         snapshots = FuelPriceSnapshot.objects.filter(
-            fuel_type__in=all_fuel_types,
+            fuel_type__in=ALL_FUEL_TYPES,
             station__isnull=True,
             source__in=[FuelPriceSource.EXTERNAL_ANP, FuelPriceSource.MANUAL],
-        ).order_by('fuel_type', '-collected_at')
+        ).annotate(
+            recency=Window(
+                RowNumber(),
+                partition_by=[F('fuel_type')],
+                order_by=[F('collected_at').desc(), F('id').desc()],
+            ),
+        ).filter(recency=1)
 
-        latest_by_type = {}
-        for snapshot in snapshots:
-            if snapshot.fuel_type not in latest_by_type:
-                latest_by_type[snapshot.fuel_type] = snapshot
+        latest_by_type = {snapshot.fuel_type: snapshot for snapshot in snapshots}
 
         expected_cost = Decimal('0.00')
         actual_cost = Decimal('0.00')
         coverage_liters = Decimal('0.00')
 
         if latest_by_type:
-            for tx in transactions.only('fuel_type', 'liters', 'total_cost'):
-                snapshot = latest_by_type.get(tx.fuel_type)
+            # One row per fuel type instead of streaming every transaction
+            by_fuel_type = transactions.order_by().values('fuel_type').annotate(
+                liters_sum=Sum('liters'),
+                cost_sum=Sum('total_cost'),
+            )
+            for row in by_fuel_type:
+                snapshot = latest_by_type.get(row['fuel_type'])
                 if snapshot:
-                    coverage_liters += tx.liters
-                    expected_cost += tx.liters * snapshot.price_per_liter
-                    actual_cost += tx.total_cost
+                    coverage_liters += row['liters_sum']
+                    expected_cost += row['liters_sum'] * snapshot.price_per_liter
+                    actual_cost += row['cost_sum']
 
         national_avg_prices = []
-        for fuel_type in all_fuel_types:
+        for fuel_type in ALL_FUEL_TYPES:
             snapshot = latest_by_type.get(fuel_type)
             national_avg_prices.append({
                 'fuel_type': fuel_type,
@@ -570,12 +635,12 @@ Retorna métricas consolidadas do período:
 
         alerts_open_count = alerts_queryset.count()
         top_alerts = list(
-            alerts_queryset.select_related('vehicle').order_by('-created_at')[:5].values(
+            alerts_queryset.order_by('-created_at').values(
                 'id', 'vehicle__name', 'type', 'severity', 'message', 'created_at'
-            )
+            )[:5]
         )
 
-        return Response({
+        return {
             'period': {
                 'from': from_date.isoformat(),
                 'to': to_date.isoformat(),
@@ -584,7 +649,7 @@ Retorna métricas consolidadas do período:
             'summary': {
                 'total_cost': total_cost,
                 'total_liters': total_liters,
-                'transaction_count': transactions.count(),
+                'transaction_count': totals['transaction_count'],
             },
             'price_reference': {
                 'national_avg_price': national_avg_price,
@@ -603,7 +668,7 @@ Retorna métricas consolidadas do período:
                 'open_count': alerts_open_count,
                 'top_alerts': top_alerts
             }
-        })
+        }
 
 
 class FetchANPPricesView(APIView):
@@ -613,9 +678,22 @@ class FetchANPPricesView(APIView):
     @extend_schema(
         tags=['fuel-prices'],
         summary='Buscar preços ANP',
-        description='Dispara busca manual de preços de combustível da ANP (Agência Nacional do Petróleo).',
+        description='''
+Dispara busca manual de preços de combustível da ANP (Agência Nacional do Petróleo).
+
+Por padrão a busca roda em segundo plano: a resposta é `202` com o `task_id`, cujo status
+pode ser consultado em `/api/fuel-prices/fetch-anp/{task_id}/`.
+Use `?sync=1` para buscar na própria requisição.
+        ''',
         request=None,
+        parameters=[
+            OpenApiParameter('sync', OpenApiTypes.STR, description='Buscar na própria requisição (0 ou 1). Padrão: 0'),
+        ],
         responses={
+            202: inline_serializer(
+                name='ANPFetchQueuedResponse',
+                fields={'task_id': drf_serializers.CharField()}
+            ),
             200: inline_serializer(
                 name='ANPFetchSuccessResponse',
                 fields={
@@ -634,6 +712,11 @@ class FetchANPPricesView(APIView):
         }
     )
     def post(self, request):
+        if request.query_params.get('sync') != '1':
+            # The ANP download can take seconds: don't hold the web worker
+            task = fetch_anp_prices_task.delay()
+            return Response({'task_id': task.id}, status=status.HTTP_202_ACCEPTED)
+
         from apps.fuel.services import fetch_and_save_anp_prices
 
         result = fetch_and_save_anp_prices()
@@ -651,6 +734,46 @@ class FetchANPPricesView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class FetchANPPricesStatusView(APIView):
+    """Poll a background ANP price fetch."""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=['fuel-prices'],
+        summary='Status da busca ANP',
+        description=(
+            'Retorna o status da tarefa de busca de preços ANP '
+            '(PENDING, STARTED, RETRY, SUCCESS ou FAILURE) e o resultado quando concluída.'
+        ),
+        responses={
+            200: inline_serializer(
+                name='ANPFetchStatusResponse',
+                fields={
+                    'task_id': drf_serializers.CharField(),
+                    'status': drf_serializers.CharField(),
+                    'result': drf_serializers.DictField(allow_null=True),
+                    'error': drf_serializers.CharField(allow_null=True),
+                }
+            ),
+        }
+    )
+    def get(self, request, task_id):
+        task = fetch_anp_prices_task.AsyncResult(task_id)
+        return Response({
+            'task_id': task_id,
+            'status': task.status,
+            'result': task.result if task.successful() else None,
+            'error': str(task.result) if task.failed() else None,
+        })
+
+
+class _EchoBuffer:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
 class FuelTransactionsExportView(APIView):
     """Export fuel transactions to CSV."""
     permission_classes = [IsAdminUser]
@@ -702,11 +825,15 @@ class FuelTransactionsExportView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Only the columns written to the CSV; the related tables are wide
         transactions = FuelTransaction.objects.select_related(
             'vehicle', 'driver', 'station', 'cost_center'
+        ).only(
+            'purchased_at', 'liters', 'unit_price', 'total_cost', 'odometer_km',
+            'fuel_type', 'notes', 'vehicle__name', 'vehicle__plate',
+            'driver__name', 'station__name', 'cost_center__name',
         ).filter(
-            purchased_at__date__gte=from_date,
-            purchased_at__date__lte=to_date
+            **local_days_filter(from_date, to_date)
         )
 
         if not include_personal:
@@ -714,20 +841,27 @@ class FuelTransactionsExportView(APIView):
                 vehicle__usage_category=UsageCategory.PERSONAL
             )
 
-        response = HttpResponse(content_type='text/csv')
+        response = StreamingHttpResponse(
+            self._iter_csv(transactions.order_by('-purchased_at')),
+            content_type='text/csv',
+        )
         response['Content-Disposition'] = (
             f'attachment; filename="abastecimentos_{from_date}_{to_date}.csv"'
         )
+        return response
 
-        writer = csv.writer(response)
-        writer.writerow([
+    @staticmethod
+    def _iter_csv(transactions):
+        """Yield the export line by line, reading rows in chunks from the DB."""
+        writer = csv.writer(_EchoBuffer())
+        yield writer.writerow([
             'Data/Hora', 'Veiculo', 'Placa', 'Motorista', 'Posto',
             'Centro de Custo', 'Litros', 'Preco/L', 'Total', 'Odometro (km)',
             'Combustivel', 'Observacoes'
         ])
 
-        for tx in transactions.order_by('-purchased_at'):
-            writer.writerow([
+        for tx in transactions.iterator(chunk_size=2000):
+            yield writer.writerow([
                 tx.purchased_at.isoformat(sep=' ', timespec='minutes'),
                 tx.vehicle.name,
                 tx.vehicle.plate,
@@ -742,8 +876,6 @@ class FuelTransactionsExportView(APIView):
                 tx.notes or '',
             ])
 
-        return response
-
 
 class DriverDashboardView(APIView):
     """Dashboard for drivers - shows their own stats and recent transactions."""
@@ -786,59 +918,83 @@ class DriverDashboardView(APIView):
         }
     )
     def get(self, request):
-        user = request.user
-
-        driver = user.driver_profile
+        driver = request.user.driver_profile
+        today = timezone.localdate()
+        thirty_days_ago = driver_dashboard_since(today)
+
+        # Cached per driver for a short TTL; FuelTransaction signals invalidate it
+        data = cache.get_or_set(
+            driver_dashboard_key(driver.id, thirty_days_ago),
+            lambda: self._build_payload(driver, thirty_days_ago, today),
+            timeout=DRIVER_DASHBOARD_TTL,
+        )
+        return Response(data)
 
-        # Get driver's transactions (last 30 days)
-        thirty_days_ago = timezone.now().date() - timedelta(days=30)
-        transactions = FuelTransaction.objects.filter(
-            driver=driver,
-            purchased_at__date__gte=thirty_days_ago
-        ).order_by('-purchased_at')
+    def _build_payload(self, driver, thirty_days_ago, today):
+        # The 30-day window of one driver is small: fetch it once and derive
+        # stats, km/L and the recent list in Python instead of three queries
+        transactions = list(
+            FuelTransaction.objects.filter(
+                driver=driver,
+                purchased_at__gte=local_day_start(thirty_days_ago)
+            ).order_by('-purchased_at').values_list(
+                'id', 'vehicle_id', 'vehicle__name', 'vehicle__plate',
+                'purchased_at', 'liters', 'total_cost', 'odometer_km',
+                named=True,
+            )
+        )
 
         # Calculate stats
-        total_liters = transactions.aggregate(total=Sum('liters'))['total'] or Decimal('0.00')
-        total_cost = transactions.aggregate(total=Sum('total_cost'))['total'] or Decimal('0.00')
-        transaction_count = transactions.count()
+        total_liters = sum((row.liters for row in transactions), Decimal('0.00'))
+        total_cost = sum((row.total_cost for row in transactions), Decimal('0.00'))
+        transaction_count = len(transactions)
 
         # Calculate average km/L if we have enough data
         avg_km_per_liter = None
-        if transactions.count() >= 2:
-            # Group by vehicle and calculate km/L
-            vehicles_with_txs = transactions.values('vehicle').distinct()
+        if transaction_count >= 2:
+            # Rows are newest first: the first seen per vehicle is the latest
+            # vehicle_id -> [latest odometer, earliest odometer, liters, count]
+            spans = {}
+            for row in transactions:
+                span = spans.setdefault(row.vehicle_id, [row.odometer_km, None, Decimal('0'), 0])
+                span[1] = row.odometer_km
+                span[2] += row.liters
+                span[3] += 1
+
             total_km = 0
             total_l = 0
-            for v in vehicles_with_txs:
-                v_txs = transactions.filter(vehicle_id=v['vehicle']).order_by('purchased_at')
-                if v_txs.count() >= 2:
-                    first_tx = v_txs.first()
-                    last_tx = v_txs.last()
-                    km = last_tx.odometer_km - first_tx.odometer_km
-                    liters = v_txs.aggregate(total=Sum('liters'))['total']
-                    if km > 0 and liters > 0:
-                        total_km += km
-                        total_l += float(liters)
+            for last_odo, first_odo, liters, n in spans.values():
+                km = last_odo - first_odo
+                if n >= 2 and km > 0 and liters > 0:
+                    total_km += km
+                    total_l += float(liters)
 
             if total_km > 0 and total_l > 0:
                 avg_km_per_liter = round(total_km / total_l, 2)
 
-        # Recent transactions (last 10)
-        recent_transactions = list(
-            transactions[:10].values(
-                'id', 'vehicle__name', 'vehicle__plate',
-                'purchased_at', 'liters', 'total_cost', 'odometer_km'
-            )
-        )
+        # Recent transactions (last 10); values are left to the renderer, as
+        # with the .values() rows this replaced
+        recent_transactions = [
+            {
+                'id': row.id,
+                'vehicle__name': row.vehicle__name,
+                'vehicle__plate': row.vehicle__plate,
+                'purchased_at': row.purchased_at,
+                'liters': row.liters,
+                'total_cost': row.total_cost,
+                'odometer_km': row.odometer_km,
+            }
+            for row in transactions[:10]
+        ]
 
-        return Response({
+        return {
             'driver': {
                 'id': str(driver.id),
                 'name': driver.name,
             },
             'period': {
                 'from': thirty_days_ago.isoformat(),
-                'to': timezone.now().date().isoformat(),
+                'to': today.isoformat(),
             },
             'stats': {
                 'total_liters': total_liters,
@@ -847,7 +1003,7 @@ class DriverDashboardView(APIView):
                 'avg_km_per_liter': avg_km_per_liter,
             },
             'recent_transactions': recent_transactions,
-        })
+        }
 
 
 class FuelTransactionsImportView(APIView):
@@ -859,6 +1015,7 @@ class FuelTransactionsImportView(APIView):
     """
     permission_classes = [IsAdminUser]
     parser_classes = [MultiPartParser]
+    upload_handler_classes = [CSVUploadHandler]
 
     @extend_schema(
         tags=['import-export'],
@@ -868,6 +1025,12 @@ Importa abastecimentos a partir de arquivo CSV.
 
 O arquivo deve seguir o formato do template disponível em `/api/import/transactions/template/`.
 Máximo 10MB por arquivo.
+
+Por padrão a importação é processada em segundo plano: a resposta é `202` com o ID
+da importação, cujo status pode ser consultado em `/api/import/transactions/{id}/`.
+Use `?sync=1` para processar na própria requisição. Nesse modo, relatórios com 100 erros
+ou mais são enviados como NDJSON (`application/x-ndjson`): a primeira linha traz
+`success` e `summary`, e cada linha seguinte um erro.
         ''',
         request={
             'multipart/form-data': {
@@ -878,7 +1041,11 @@ Máximo 10MB por arquivo.
                 'required': ['file']
             }
         },
+        parameters=[
+            OpenApiParameter('sync', OpenApiTypes.STR, description='Processar na própria requisição (0 ou 1). Padrão: 0'),
+        ],
         responses={
+            202: FuelTransactionImportSerializer,
             200: inline_serializer(
                 name='ImportSuccessResponse',
                 fields={
@@ -897,37 +1064,102 @@ Máximo 10MB por arquivo.
         }
     )
     def post(self, request):
+        upload_handler = self._get_upload_handler(request)
         file = request.FILES.get('file')
+        if upload_handler.too_large or (file and file.size > CSV_IMPORT_MAX_BYTES):
+            return Response(
+                {'error': 'Arquivo muito grande. Maximo permitido: 10MB.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         if not file:
             return Response(
                 {'error': 'Arquivo CSV e obrigatorio.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Validate file extension
+        # Validate file extension and content type
         filename = file.name.lower()
-        if not filename.endswith('.csv'):
+        content_type = (file.content_type or '').split(';')[0].strip().lower()
+        if not filename.endswith('.csv') or (
+            content_type not in CSV_CONTENT_TYPES and content_type not in GENERIC_CONTENT_TYPES
+        ):
             return Response(
                 {'error': 'Arquivo deve ser no formato CSV.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Validate file size (max 10MB)
-        if file.size > 10 * 1024 * 1024:
-            return Response(
-                {'error': 'Arquivo muito grande. Maximo permitido: 10MB.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        # Synchronous import kept for small files / scripts
+        if request.query_params.get('sync') == '1':
+            try:
+                result = import_fuel_transactions(file)
+                response_status = status.HTTP_200_OK if result.success else status.HTTP_400_BAD_REQUEST
+                if result.error_count >= NDJSON_MIN_ERRORS:
+                    # Large error reports are streamed one error per line
+                    return StreamingHttpResponse(
+                        result.iter_ndjson(),
+                        content_type='application/x-ndjson',
+                        status=response_status,
+                    )
+                return Response(result.to_dict(), status=response_status)
+            except Exception as e:
+                return Response(
+                    {'error': f'Erro ao processar arquivo: {str(e)}'},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
 
-        try:
-            result = import_fuel_transactions(file.read())
-            response_status = status.HTTP_200_OK if result.success else status.HTTP_400_BAD_REQUEST
-            return Response(result.to_dict(), status=response_status)
-        except Exception as e:
-            return Response(
-                {'error': f'Erro ao processar arquivo: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        upload = FuelTransactionImport.objects.create(file=file, created_by=request.user)
+        task = import_fuel_transactions_task.delay(str(upload.id))
+        upload.task_id = task.id or ''
+        upload.save(update_fields=['task_id', 'updated_at'])
+
+        # Answer with the queued state held in memory; progress is polled
+
+        return Response(
+            FuelTransactionImportSerializer(upload).data,
+            status=status.HTTP_202_ACCEPTED
+        )
+
+    def _get_upload_handler(self, request):
+        """
+        Size-capped handler for this upload.
+
+        Usually installed by WAFMiddleware before it parses the body; set it
+        here when the body has not been read yet.
+        """
+        django_request = request._request
+        if not hasattr(django_request, '_files'):
+            django_request.upload_handlers = [CSVUploadHandler(django_request)]
+
+        for handler in django_request.upload_handlers:
+            if isinstance(handler, CSVUploadHandler):
+                return handler
+        return CSVUploadHandler(django_request)
+
+
+class FuelTransactionsImportStatusView(APIView):
+    """Poll the status of a background CSV import."""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=['import-export'],
+        summary='Status da importação',
+        description='Retorna o status de uma importação em segundo plano e o relatório quando concluída.',
+        responses={200: FuelTransactionImportSerializer},
+    )
+    def get(self, request, pk):
+        upload = get_object_or_404(FuelTransactionImport, pk=pk)
+        return Response(FuelTransactionImportSerializer(upload).data)
+
+
+# The template and the format spec only change with a deploy: build them once
+# and let clients revalidate with If-None-Match instead of re-downloading.
+CSV_TEMPLATE = generate_csv_template()
+CSV_TEMPLATE_ETAG = hashlib.sha256(CSV_TEMPLATE.encode('utf-8')).hexdigest()[:32]
+CSV_FORMAT_SPEC = get_csv_format_specification()
+CSV_FORMAT_SPEC_ETAG = hashlib.sha256(
+    json.dumps(CSV_FORMAT_SPEC, sort_keys=True).encode('utf-8')
+).hexdigest()[:32]
 
 
 class FuelTransactionsImportTemplateView(APIView):
@@ -940,10 +1172,10 @@ class FuelTransactionsImportTemplateView(APIView):
         description='Baixa o modelo de arquivo CSV para importação de abastecimentos.',
         responses={(200, 'text/csv'): OpenApiTypes.BINARY},
     )
+    @method_decorator(cache_control(private=True, max_age=60 * 60 * 24))
+    @method_decorator(etag(lambda request: CSV_TEMPLATE_ETAG))
     def get(self, request):
-        template = generate_csv_template()
-
-        response = HttpResponse(template, content_type='text/csv; charset=utf-8')
+        response = HttpResponse(CSV_TEMPLATE, content_type='text/csv; charset=utf-8')
         response['Content-Disposition'] = 'attachment; filename="modelo_importacao_abastecimentos.csv"'
         return response
 
@@ -958,5 +1190,7 @@ class FuelTransactionsImportFormatView(APIView):
         description='Retorna a especificação detalhada do formato CSV para importação.',
         responses={200: OpenApiTypes.OBJECT},
     )
+    @method_decorator(cache_control(private=True, max_age=60 * 60 * 24))
+    @method_decorator(etag(lambda request: CSV_FORMAT_SPEC_ETAG))
     def get(self, request):
-        return Response(get_csv_format_specification())
+        return Response(CSV_FORMAT_SPEC)
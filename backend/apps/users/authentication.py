@@ -0,0 +1,35 @@
+"""
+JWT authentication that loads the driver profile (and its current vehicle)
+with the user.
+"""
+from django.contrib.auth import get_user_model
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class _UserModelWithDriverProfile:
+    """
+    Stand-in for the user model inside JWTAuthentication.get_user().
+
+    simplejwt looks users up with `self.user_model.objects.get(...)`; exposing
+    a select_related queryset as `objects` folds the driver_profile lookup
+    done by the permission classes, and the current vehicle read by the
+    profile and driver fuel entry views, into that same query.
+    """
+
+    def __init__(self, model):
+        self.objects = model.objects.select_related('driver_profile__current_vehicle')
+        self.DoesNotExist = model.DoesNotExist
+
+
+class DriverProfileJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication whose user already carries `driver_profile.current_vehicle`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_model = _UserModelWithDriverProfile(get_user_model())
+
+
+class DriverProfileJWTScheme(SimpleJWTScheme):
+    """Document DriverProfileJWTAuthentication as the regular JWT bearer scheme."""
+    target_class = 'apps.users.authentication.DriverProfileJWTAuthentication'
@@ -0,0 +1,66 @@
+"""
+Cache helpers for the users app.
+
+The rendered profile body is cached per user for a short TTL and invalidated by
+the User, Driver and Vehicle signals whenever its source rows change.
+
+A refresh token's result can be kept for JWT_REFRESH_REUSE_SECONDS (off by
+default), so parallel refreshes with the same (single-use) token from the
+same client all succeed. The entry is bound to the client: a rotated token
+replayed from anywhere else still hits the blacklist.
+
+Clients that hit the login throttle are remembered until the throttle would
+let them through again, so ThrottleBlacklistMiddleware can answer them early.
+"""
+import hashlib
+import math
+import time
+
+from django.core.cache import cache
+
+USER_PROFILE_TTL = 45  # seconds
+
+
+def user_profile_key(user_id):
+    """Cache key for a user profile payload."""
+    return f'user_profile:{user_id}'
+
+
+def invalidate_user_profile(*user_ids):
+    """Drop cached profiles for the given users."""
+    keys = [user_profile_key(user_id) for user_id in user_ids if user_id]
+    if keys:
+        cache.delete_many(keys)
+
+
+def refresh_result_key(refresh_token, client_ident, user_agent):
+    """
+    Cache key for the pair issued for a refresh token to one client.
+
+    The token, client address and User-Agent are hashed together, never stored.
+    """
+    digest = hashlib.sha256(
+        '\0'.join((refresh_token, client_ident or '', user_agent or '')).encode()
+    ).hexdigest()
+    return f'jwt_refresh:{digest}'
+
+
+def _login_block_key(ident):
+    """Cache key for a blocked client; the address is hashed, never stored."""
+    return f'login_blocked:{hashlib.sha256(ident.encode()).hexdigest()}'
+
+
+def block_login(ident, seconds):
+    """Reject token requests from `ident` for `seconds` without hitting DRF."""
+    if ident and seconds and seconds > 0:
+        cache.set(_login_block_key(ident), time.time() + seconds, timeout=math.ceil(seconds))
+
+
+def login_blocked_for(ident):
+    """Seconds left on the block of `ident` (0 when it is not blocked)."""
+    if not ident:
+        return 0
+    blocked_until = cache.get(_login_block_key(ident))
+    if blocked_until is None:
+        return 0
+    return max(0, math.ceil(blocked_until - time.time()))
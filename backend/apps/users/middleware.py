@@ -0,0 +1,39 @@
+"""
+Early rejection of clients blocked by the login throttle.
+"""
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils.functional import cached_property
+
+from .cache import login_blocked_for
+from .throttling import LoginRateThrottle
+
+
+class ThrottleBlacklistMiddleware:
+    """
+    Answer token requests from throttled clients with 429 right away.
+
+    LoginRateThrottle records a client when it rejects it; until that block
+    expires the token endpoints are refused here, before sessions, CSRF,
+    authentication and DRF run. Other endpoints are never affected.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    @cached_property
+    def protected_paths(self):
+        return frozenset({reverse('token_obtain_pair'), reverse('token_refresh')})
+
+    def __call__(self, request):
+        if request.method == 'POST' and request.path in self.protected_paths:
+            wait = login_blocked_for(LoginRateThrottle().get_ident(request))
+            if wait:
+                response = JsonResponse(
+                    {'detail': f'Muitas tentativas. Tente novamente em {wait} segundos.'},
+                    status=429,
+                )
+                response['Retry-After'] = str(wait)
+                return response
+
+        return self.get_response(request)
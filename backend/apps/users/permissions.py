@@ -24,8 +24,7 @@ class IsDriver(BasePermission):
         return bool(
             request.user and
             request.user.is_authenticated and
-            hasattr(request.user, 'driver_profile') and
-            request.user.driver_profile is not None
+            getattr(request.user, 'driver_profile', None) is not None
         )
 
 
@@ -42,10 +41,7 @@ class IsAdminOrDriver(BasePermission):
             return True
 
         # Driver has access
-        if hasattr(request.user, 'driver_profile') and request.user.driver_profile is not None:
-            return True
-
-        return False
+        return getattr(request.user, 'driver_profile', None) is not None
 
 
 class IsAdminOrReadOnly(BasePermission):
@@ -68,14 +64,23 @@ def get_user_role(user):
     """
     Get the role of a user.
     Returns: 'admin', 'driver', or None
+
+    The result is memoized on the user object, which lives for one request.
     """
     if not user or not user.is_authenticated:
         return None
 
-    if user.is_staff:
-        return 'admin'
-
-    if hasattr(user, 'driver_profile') and user.driver_profile is not None:
-        return 'driver'
+    try:
+        return user._role_cache
+    except AttributeError:
+        pass
 
-    return None
+    if user.is_staff:
+        role = 'admin'
+    elif getattr(user, 'driver_profile', None) is not None:
+        role = 'driver'
+    else:
+        role = None
+
+    user._role_cache = role
+    return role
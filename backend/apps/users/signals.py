@@ -0,0 +1,45 @@
+"""
+Signals that keep the cached user profile in sync.
+
+The profile payload embeds the user, its driver profile and the driver's
+current vehicle, so changes to any of them drop the cached copy.
+"""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.core.models import Driver, Vehicle
+
+from .cache import invalidate_user_profile
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_profile_on_user_change(sender, instance, **kwargs):
+    invalidate_user_profile(instance.pk)
+
+
+@receiver(pre_save, sender=Driver)
+def remember_previous_user(sender, instance, **kwargs):
+    """Keep the stored user so a reassignment also invalidates its profile."""
+    if instance._state.adding:
+        instance._previous_user_id = None
+        return
+    instance._previous_user_id = (
+        Driver.objects.filter(pk=instance.pk)
+        .values_list('user_id', flat=True)
+        .first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Driver)
+def invalidate_profile_on_driver_change(sender, instance, **kwargs):
+    invalidate_user_profile(instance.user_id, getattr(instance, '_previous_user_id', None))
+
+
+@receiver([post_save, pre_delete], sender=Vehicle)
+def invalidate_profile_on_vehicle_change(sender, instance, **kwargs):
+    # pre_delete: drivers still reference the vehicle (SET_NULL runs later)
+    user_ids = Driver.objects.filter(
+        current_vehicle=instance, user__isnull=False
+    ).values_list('user_id', flat=True)
+    invalidate_user_profile(*user_ids)
@@ -14,7 +14,9 @@ def test_login_sets_refresh_cookie(api_client, admin_user):
     assert response.status_code == 200
     assert "access" in response.data
     assert "refresh" not in response.data
-    assert settings.JWT_REFRESH_COOKIE_NAME in response.cookies
+    cookie = response.cookies[settings.JWT_REFRESH_COOKIE_NAME]
+    assert cookie["httponly"] is True
+    assert cookie["max-age"] == int(settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds())
 
 
 def test_refresh_uses_cookie(api_client, admin_user):
@@ -43,6 +45,217 @@ def test_profile_returns_driver_info(driver_api_client, driver):
     response = driver_api_client.get("/api/auth/profile/")
 
     assert response.status_code == 200
-    assert response.data["role"] == "driver"
-    assert response.data["driver"]["id"] == str(driver.id)
-    assert response.data["driver"]["current_vehicle"]["id"] == str(driver.current_vehicle_id)
+    data = response.json()
+    assert data["role"] == "driver"
+    assert data["driver"]["id"] == str(driver.id)
+    assert data["driver"]["current_vehicle"]["id"] == str(driver.current_vehicle_id)
+
+
+def test_jwt_authentication_loads_driver_profile_with_user(api_client, driver_user, driver):
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from apps.users.authentication import DriverProfileJWTAuthentication
+
+    token = AccessToken.for_user(driver_user)
+    authenticator = DriverProfileJWTAuthentication()
+    user = authenticator.get_user(authenticator.get_validated_token(str(token)))
+
+    assert "driver_profile" in user._state.fields_cache
+    assert "current_vehicle" in user.driver_profile._state.fields_cache
+    assert user.driver_profile == driver
+
+
+def test_profile_is_cached_and_invalidated_on_driver_change(
+    driver_api_client, driver, django_assert_num_queries
+):
+    first = driver_api_client.get("/api/auth/profile/")
+    assert first.status_code == 200
+
+    with django_assert_num_queries(0):
+        cached = driver_api_client.get("/api/auth/profile/")
+    assert cached.content == first.content
+
+    driver.phone = "11999990000"
+    driver.save()
+
+    updated = driver_api_client.get("/api/auth/profile/")
+    assert updated.json()["driver"]["phone"] == "11999990000"
+
+
+def test_profile_of_previous_user_is_invalidated_when_driver_is_reassigned(
+    api_client, driver_user, driver, admin_user
+):
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    # Authenticate with a token so each request loads the user afresh
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(driver_user)}")
+    assert api_client.get("/api/auth/profile/").json()["role"] == "driver"
+
+    driver.user = admin_user
+    driver.save()
+
+    data = api_client.get("/api/auth/profile/").json()
+    assert data["role"] != "driver"
+    assert not data.get("driver")
+
+
+def test_throttled_client_is_rejected_before_authentication(
+    api_client, admin_user, django_assert_num_queries
+):
+    credentials = {"username": admin_user.username, "password": "wrong"}
+    for _ in range(5):
+        assert api_client.post("/api/auth/token/", credentials, format="json").status_code == 401
+
+    throttled = api_client.post("/api/auth/token/", credentials, format="json")
+    assert throttled.status_code == 429
+
+    with django_assert_num_queries(0):
+        blocked = api_client.post("/api/auth/token/", credentials, format="json")
+    assert blocked.status_code == 429
+    assert int(blocked["Retry-After"]) > 0
+    assert "Muitas tentativas" in blocked.json()["detail"]
+
+
+def test_blocked_login_response_carries_cors_headers(api_client):
+    from apps.users.cache import block_login
+
+    origin = settings.CORS_ALLOWED_ORIGINS[0]
+    block_login("127.0.0.1", 60)
+
+    blocked = api_client.post(
+        "/api/auth/token/", {"username": "x", "password": "y"}, format="json", HTTP_ORIGIN=origin
+    )
+
+    assert blocked.status_code == 429
+    assert blocked["Access-Control-Allow-Origin"] == origin
+    assert "Retry-After" in blocked["Access-Control-Expose-Headers"]
+
+
+def test_parallel_refreshes_with_same_token_share_the_result(monkeypatch, api_client, admin_user):
+    monkeypatch.setattr("apps.users.views._REFRESH_REUSE_SECONDS", 30)
+    login = api_client.post(
+        "/api/auth/token/",
+        {"username": admin_user.username, "password": "admin123"},
+        format="json",
+    )
+    refresh_token = login.cookies[settings.JWT_REFRESH_COOKIE_NAME].value
+
+    first = api_client.post("/api/auth/token/refresh/", {"refresh": refresh_token}, format="json")
+    second = api_client.post("/api/auth/token/refresh/", {"refresh": refresh_token}, format="json")
+
+    assert first.status_code == second.status_code == 200
+    assert first.data["access"] == second.data["access"]
+    assert (
+        first.cookies[settings.JWT_REFRESH_COOKIE_NAME].value
+        == second.cookies[settings.JWT_REFRESH_COOKIE_NAME].value
+    )
+
+
+def test_rotated_token_replayed_from_another_client_is_rejected(monkeypatch, api_client, admin_user):
+    from rest_framework.test import APIClient
+
+    monkeypatch.setattr("apps.users.views._REFRESH_REUSE_SECONDS", 30)
+    login = api_client.post(
+        "/api/auth/token/",
+        {"username": admin_user.username, "password": "admin123"},
+        format="json",
+    )
+    refresh_token = login.cookies[settings.JWT_REFRESH_COOKIE_NAME].value
+
+    first = api_client.post("/api/auth/token/refresh/", {"refresh": refresh_token}, format="json")
+    assert first.status_code == 200
+
+    attacker = APIClient(REMOTE_ADDR="203.0.113.7", HTTP_USER_AGENT="curl/8.0")
+    replay = attacker.post("/api/auth/token/refresh/", {"refresh": refresh_token}, format="json")
+
+    assert replay.status_code == 401
+    assert "access" not in replay.data
+
+
+def test_rotated_token_is_rejected_when_reuse_is_disabled(api_client, admin_user):
+    login = api_client.post(
+        "/api/auth/token/",
+        {"username": admin_user.username, "password": "admin123"},
+        format="json",
+    )
+    refresh_token = login.cookies[settings.JWT_REFRESH_COOKIE_NAME].value
+
+    first = api_client.post("/api/auth/token/refresh/", {"refresh": refresh_token}, format="json")
+    second = api_client.post("/api/auth/token/refresh/", {"refresh": refresh_token}, format="json")
+
+    assert first.status_code == 200
+    assert second.status_code == 401
+
+
+def test_logout_expires_refresh_cookie(api_client):
+    response = api_client.post("/api/auth/logout/")
+
+    assert response.status_code == 204
+    cookie = response.cookies[settings.JWT_REFRESH_COOKIE_NAME]
+    assert cookie.value == ""
+    assert cookie["max-age"] == 0
+    assert cookie["path"] == settings.JWT_COOKIE_PATH
+
+
+def test_login_throttle_uses_redis_window_when_configured(monkeypatch, api_client, admin_user):
+    from apps.users import throttling
+
+    calls = []
+
+    def script(keys, args):
+        calls.append((keys, args))
+        now_ms, window_ms, limit, _ = args
+        return [0, now_ms - window_ms + 12_000]  # oldest request expires in 12s
+
+    monkeypatch.setattr(throttling, "_sliding_window_script", lambda: script)
+
+    response = api_client.post(
+        "/api/auth/token/",
+        {"username": admin_user.username, "password": "admin123"},
+        format="json",
+    )
+
+    assert response.status_code == 429
+    assert response["Retry-After"] == "12"
+    assert calls[0][0] == ["throttle:login:127.0.0.1"]
+    assert calls[0][1][1:3] == [60_000, 5]
+
+
+def test_refresh_without_token_is_rejected(api_client):
+    response = api_client.post("/api/auth/token/refresh/", {}, format="json")
+
+    assert response.status_code == 401
+
+
+def test_default_throttle_counts_in_redis_when_configured(monkeypatch, driver_api_client, driver):
+    from apps.users import throttling
+
+    counters = {}
+
+    class Pipeline:
+        def __init__(self):
+            self.ops = []
+
+        def set(self, key, value, ex, nx):
+            self.ops.append(lambda: counters.setdefault(key, value))
+
+        def incr(self, key):
+            def op():
+                counters[key] += 1
+                return counters[key]
+            self.ops.append(op)
+
+        def execute(self):
+            return [op() for op in self.ops]
+
+    class Client:
+        def pipeline(self):
+            return Pipeline()
+
+    monkeypatch.setattr(throttling, "_redis_client", lambda: Client())
+    monkeypatch.setattr(throttling.RedisUserRateThrottle, "THROTTLE_RATES", {"user": "2/minute", "anon": None})
+
+    statuses = [driver_api_client.get("/api/vehicles/").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+    assert list(counters.values()) == [3]
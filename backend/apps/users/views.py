@@ -1,20 +1,21 @@
+from operator import attrgetter
+
+import orjson
 from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import serializers as drf_serializers
 from rest_framework import serializers, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.throttling import AnonRateThrottle
 from rest_framework.views import APIView
 from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from .cache import USER_PROFILE_TTL, refresh_result_key, user_profile_key
 from .permissions import get_user_role
-
-
-class LoginRateThrottle(AnonRateThrottle):
-    """Rate limit for login attempts to prevent brute force attacks."""
-    rate = '5/minute'
+from .throttling import LoginRateThrottle
 
 
 @extend_schema(
@@ -47,65 +48,93 @@ class ThrottledTokenRefreshView(TokenRefreshView):
     throttle_classes = [LoginRateThrottle]
 
 
+# Refresh cookie settings are fixed for the process lifetime
+_REFRESH_MAX_AGE = int(settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds())
+_COOKIE_NAME = settings.JWT_REFRESH_COOKIE_NAME
+_COOKIE_SECURE = settings.JWT_COOKIE_SECURE
+_COOKIE_SAMESITE = settings.JWT_COOKIE_SAMESITE
+_COOKIE_DOMAIN = settings.JWT_COOKIE_DOMAIN
+_COOKIE_PATH = settings.JWT_COOKIE_PATH
+_REFRESH_REUSE_SECONDS = settings.JWT_REFRESH_REUSE_SECONDS
+
+
+def _write_refresh_cookie(response, value, max_age):
+    """
+    Write the refresh cookie straight into response.cookies.
+
+    Equivalent to set_cookie() with fixed options, minus its per-call
+    validation and the Expires date formatting: Max-Age alone is enough
+    for the browsers we support (RFC 6265).
+    """
+    response.cookies[_COOKIE_NAME] = value
+    morsel = response.cookies[_COOKIE_NAME]
+    morsel['max-age'] = max_age
+    morsel['path'] = _COOKIE_PATH
+    morsel['httponly'] = True
+    morsel['samesite'] = _COOKIE_SAMESITE
+    if _COOKIE_SECURE:
+        morsel['secure'] = True
+    if _COOKIE_DOMAIN:
+        morsel['domain'] = _COOKIE_DOMAIN
+
+
 def _set_refresh_cookie(response, refresh_token):
-    max_age = int(settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds())
-    response.set_cookie(
-        settings.JWT_REFRESH_COOKIE_NAME,
-        refresh_token,
-        max_age=max_age,
-        httponly=True,
-        secure=settings.JWT_COOKIE_SECURE,
-        samesite=settings.JWT_COOKIE_SAMESITE,
-        domain=settings.JWT_COOKIE_DOMAIN,
-        path=settings.JWT_COOKIE_PATH,
-    )
+    _write_refresh_cookie(response, refresh_token, _REFRESH_MAX_AGE)
 
 
 def _clear_refresh_cookie(response):
-    response.delete_cookie(
-        settings.JWT_REFRESH_COOKIE_NAME,
-        domain=settings.JWT_COOKIE_DOMAIN,
-        path=settings.JWT_COOKIE_PATH,
-        samesite=settings.JWT_COOKIE_SAMESITE,
-    )
+    _write_refresh_cookie(response, '', 0)
 
 
-class CookieTokenObtainPairView(ThrottledTokenObtainPairView):
-    """Token obtain view that stores refresh token in HttpOnly cookie."""
+class RefreshCookieMixin:
+    """Move the refresh token of a token response into the HttpOnly cookie."""
 
     def post(self, request, *args, **kwargs):
         response = super().post(request, *args, **kwargs)
-        refresh = response.data.get('refresh')
+        refresh = response.data.pop('refresh', None)
         if refresh:
             _set_refresh_cookie(response, refresh)
-            response.data.pop('refresh', None)
         return response
 
 
+class CookieTokenObtainPairView(RefreshCookieMixin, ThrottledTokenObtainPairView):
+    """Token obtain view that stores refresh token in HttpOnly cookie."""
+
+
 class CookieTokenRefreshSerializer(TokenRefreshSerializer):
     """Read refresh token from cookie when not provided in request body."""
     refresh = serializers.CharField(required=False)
 
     def validate(self, attrs):
-        if 'refresh' not in attrs or not attrs.get('refresh'):
-            refresh = self.context['request'].COOKIES.get(settings.JWT_REFRESH_COOKIE_NAME)
-            if refresh:
-                attrs['refresh'] = refresh
-        return super().validate(attrs)
-
-
-class CookieTokenRefreshView(ThrottledTokenRefreshView):
+        # Never None: simplejwt builds a brand new token from token=None
+        attrs['refresh'] = attrs.get('refresh') or self.context['request'].COOKIES.get(_COOKIE_NAME, '')
+
+        # Concurrent refreshes with the same token from the same client
+        # (several tabs) get the pair issued to the first one instead of
+        # failing on the blacklist. Other clients still go through it.
+        key = None
+        if attrs['refresh'] and _REFRESH_REUSE_SECONDS:
+            request = self.context['request']
+            key = refresh_result_key(
+                attrs['refresh'],
+                LoginRateThrottle().get_ident(request),
+                request.META.get('HTTP_USER_AGENT', ''),
+            )
+        if key:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        data = super().validate(attrs)
+        if key:
+            cache.set(key, data, timeout=_REFRESH_REUSE_SECONDS)
+        return data
+
+
+class CookieTokenRefreshView(RefreshCookieMixin, ThrottledTokenRefreshView):
     """Token refresh view that uses HttpOnly cookie for refresh token."""
     serializer_class = CookieTokenRefreshSerializer
 
-    def post(self, request, *args, **kwargs):
-        response = super().post(request, *args, **kwargs)
-        refresh = response.data.get('refresh')
-        if refresh:
-            _set_refresh_cookie(response, refresh)
-            response.data.pop('refresh', None)
-        return response
-
 
 class LogoutView(APIView):
     """Clear refresh token cookie."""
@@ -124,6 +153,14 @@ class LogoutView(APIView):
         return response
 
 
+# Fixed shape of the profile payload, read with C-level attrgetters
+_PROFILE_USER_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name')
+_profile_user_values = attrgetter(*_PROFILE_USER_FIELDS)
+_profile_driver_values = attrgetter('id', 'name', 'phone')
+_PROFILE_VEHICLE_FIELDS = ('id', 'name', 'plate', 'fuel_type')
+_profile_vehicle_values = attrgetter(*_PROFILE_VEHICLE_FIELDS)
+
+
 class UserProfileView(APIView):
     """Get current user profile including role and permissions."""
     permission_classes = [IsAuthenticated]
@@ -151,37 +188,40 @@ class UserProfileView(APIView):
     )
     def get(self, request):
         user = request.user
+        # The rendered JSON body is cached per user for a short TTL
+        # (User/Driver/Vehicle signals invalidate it), so a hit skips both
+        # the payload construction and DRF's renderer
+        body = cache.get_or_set(
+            user_profile_key(user.pk),
+            lambda: orjson.dumps(self._build_payload(user)),
+            timeout=USER_PROFILE_TTL,
+        )
+        return HttpResponse(body, content_type='application/json')
+
+    @staticmethod
+    def _build_payload(user):
         role = get_user_role(user)
 
-        # Base user data
-        data = {
-            'id': user.id,
-            'username': user.username,
-            'email': user.email,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'role': role,
-            'is_admin': user.is_staff,
-            'is_driver': role == 'driver',
-        }
+        # Base user data (UUIDs are left to orjson, which writes them in C)
+        data = dict(zip(_PROFILE_USER_FIELDS, _profile_user_values(user)))
+        data['role'] = role
+        data['is_admin'] = user.is_staff
+        data['is_driver'] = role == 'driver'
 
         # Add driver-specific data if user is a driver
-        if role == 'driver' and hasattr(user, 'driver_profile'):
-            driver = user.driver_profile
+        driver = getattr(user, 'driver_profile', None)
+        if role == 'driver' and driver is not None:
+            driver_id, name, phone = _profile_driver_values(driver)
             current_vehicle = driver.current_vehicle
             data['driver'] = {
-                'id': str(driver.id),
-                'name': driver.name,
-                'phone': driver.phone,
-                'current_vehicle': (
-                    {
-                        'id': str(current_vehicle.id),
-                        'name': current_vehicle.name,
-                        'plate': current_vehicle.plate,
-                        'fuel_type': current_vehicle.fuel_type,
-                    }
-                    if current_vehicle else None
-                ),
+                'id': driver_id,
+                'name': name,
+                'phone': phone,
+                'current_vehicle': None,
             }
+            if current_vehicle is not None:
+                data['driver']['current_vehicle'] = dict(
+                    zip(_PROFILE_VEHICLE_FIELDS, _profile_vehicle_values(current_vehicle))
+                )
 
-        return Response(data)
+        return data
@@ -69,6 +69,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    # After CORS so early 429s reach the SPA with Access-Control-* headers
+    'apps.users.middleware.ThrottleBlacklistMiddleware',
     'apps.core.middleware.WAFMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -106,6 +108,9 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default=''),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='5432'),
+        # Reuse connections across requests; checked before reuse
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -137,19 +142,23 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.DriverProfileJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.ORJSONRenderer',
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'apps.users.throttling.RedisAnonRateThrottle',
+        'apps.users.throttling.RedisUserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '20/minute',      # Limite para usuários não autenticados
@@ -225,6 +234,13 @@ JWT_COOKIE_SECURE = config('JWT_COOKIE_SECURE', default=not DEBUG, cast=bool)
 JWT_COOKIE_SAMESITE = config('JWT_COOKIE_SAMESITE', default='Lax')
 JWT_COOKIE_DOMAIN = config('JWT_COOKIE_DOMAIN', default=None)
 JWT_COOKIE_PATH = config('JWT_COOKIE_PATH', default='/api/auth/')
+if not JWT_COOKIE_PATH.startswith('/api/auth/'):
+    # A wider path would send the refresh token with every API request
+    raise ImproperlyConfigured('JWT_COOKIE_PATH must be scoped to /api/auth/')
+# Window in which a rotated refresh token still returns the pair issued for it
+# to the same client (IP + User-Agent; parallel refreshes from several tabs).
+# 0 (default) disables reuse: every replay goes through the blacklist.
+JWT_REFRESH_REUSE_SECONDS = config('JWT_REFRESH_REUSE_SECONDS', default=0, cast=int)
 
 # CORS
 CORS_ALLOWED_ORIGINS = config(
@@ -233,6 +249,8 @@ CORS_ALLOWED_ORIGINS = config(
     cast=Csv()
 )
 CORS_ALLOW_CREDENTIALS = True
+# Lets the SPA read how long a throttled login has to wait
+CORS_EXPOSE_HEADERS = ['Retry-After']
 CORS_ALLOWED_ORIGIN_REGEXES = [
     regex for regex in config('CORS_ALLOWED_ORIGIN_REGEXES', default='', cast=Csv())
     if regex
@@ -260,9 +278,36 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+# Processes used by the CSV import task to parse rows (1 = no pool).
+# Keep it low when running several prefork Celery workers on the same host.
+CSV_IMPORT_WORKERS = config('CSV_IMPORT_WORKERS', default=1, cast=int)
+
+# Write audit log entries from a Celery task instead of inside the request
+AUDIT_ASYNC = config('AUDIT_ASYNC', default=False, cast=bool)
+
 # Redis Pub/Sub channel for realtime events
 REDIS_PUBSUB_CHANNEL = 'topnet.frotas.events'
 
+# Cache (dashboards, profile, throttling, login blocks)
+# Requires a reachable Redis at CACHE_URL (falls back to REDIS_URL, which
+# Celery needs anyway). The backend fails open: if Redis is down, cache reads
+# miss and writes are skipped, so responses are computed from the database.
+CACHES = {
+    'default': {
+        'BACKEND': 'apps.core.cache_backends.FailOpenRedisCache',
+        'LOCATION': config('CACHE_URL', default=config('REDIS_URL', default='redis://localhost:6379/0')),
+        'KEY_PREFIX': 'topnet',
+        'OPTIONS': {
+            # Keep an outage from stalling requests on the cache round-trip
+            'socket_connect_timeout': 1,
+            'socket_timeout': 1,
+        },
+    }
+}
+
+# Redis used by the API throttles (empty = DRF's cache-based throttling)
+THROTTLE_REDIS_URL = config('THROTTLE_REDIS_URL', default=CACHES['default']['LOCATION'])
+
 # Email Configuration
 EMAIL_BACKEND = config(
     'EMAIL_BACKEND',
@@ -1,17 +1,26 @@
 from .settings import *  # noqa: F403, F401
 
 
-# Use SQLite for tests to avoid external DB dependencies
+# Use in-memory SQLite for tests to avoid external DB dependencies and disk I/O
+# (also keeps management commands run with these settings from leaving a file)
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "test_db.sqlite3",  # noqa: F405
+        "NAME": "file:memdb_default?mode=memory&cache=shared",
     }
 }
 
 CELERY_BROKER_URL = ""
-CELERY_RESULT_BACKEND = ""
+CELERY_RESULT_BACKEND = "cache+memory://"
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_STORE_EAGER_RESULT = True
 REDIS_URL = ""
+THROTTLE_REDIS_URL = ""
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
 ALERT_NOTIFICATION_EMAILS = []
 
 MEDIA_ROOT = BASE_DIR / "test_media"  # noqa: F405
@@ -1,12 +1,15 @@
 """
 TopNet Frotas - URL Configuration
 """
+import time
+from datetime import datetime, timezone
+
+import orjson
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.urls import include, path
-from django.utils import timezone
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -14,12 +17,23 @@ from drf_spectacular.views import (
 )
 
 
+# (second, body) of the last health check response; probes hit this often
+# and a timestamp with one-second resolution is enough
+_health_check_body = (None, b'')
+
+
 def health_check(request):
-    return JsonResponse({
-        'status': 'ok',
-        'service': 'TopNet Frotas API',
-        'timestamp': timezone.now().isoformat(),
-    })
+    global _health_check_body
+    second = int(time.time())
+    cached_second, body = _health_check_body
+    if cached_second != second:
+        body = orjson.dumps({
+            'status': 'ok',
+            'service': 'TopNet Frotas API',
+            'timestamp': datetime.fromtimestamp(second, tz=timezone.utc).isoformat(timespec='seconds'),
+        })
+        _health_check_body = (second, body)
+    return HttpResponse(body, content_type='application/json')
 
 urlpatterns = [
     path('', health_check),
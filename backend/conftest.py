@@ -1,5 +1,7 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APIClient
 
@@ -14,18 +16,34 @@ from apps.core.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
 
 
+@pytest.fixture(scope="session")
+def password_hashes():
+    """Fixture passwords hashed once per session."""
+    return {
+        "admin123": make_password("admin123"),
+        "driver123": make_password("driver123"),
+    }
+
+
 @pytest.fixture
-def admin_user():
+def admin_user(password_hashes):
     User = get_user_model()
-    user = User.objects.create_user(
+    user = User.objects.create(
         username="admin_test",
         email="admin@example.com",
-        password="admin123",
+        password=password_hashes["admin123"],
         is_staff=True,
         is_superuser=True,
     )
@@ -33,12 +51,12 @@ def admin_user():
 
 
 @pytest.fixture
-def driver_user():
+def driver_user(password_hashes):
     User = get_user_model()
-    user = User.objects.create_user(
+    user = User.objects.create(
         username="driver_test",
         email="driver@example.com",
-        password="driver123",
+        password=password_hashes["driver123"],
         is_staff=False,
     )
     return user
@@ -94,6 +112,32 @@ def driver(driver_user, vehicle_operational):
     )
 
 
+@pytest.fixture
+def seed_fleet():
+    """
+    Ten operational vehicles, each with an assigned driver.
+
+    Rows are inserted with one bulk_create per model (model signals do not
+    fire), for tests that just need some fleet data.
+    """
+    vehicles = Vehicle.objects.bulk_create([
+        Vehicle(
+            plate=f"FLT{index:04d}",
+            name=f"Frota {index}",
+            model="Strada",
+            fuel_type=FuelType.GASOLINE,
+            usage_category=UsageCategory.OPERATIONAL,
+            tank_capacity_liters=55,
+        )
+        for index in range(10)
+    ], batch_size=200)
+    drivers = Driver.objects.bulk_create([
+        Driver(name=f"Motorista {index}", current_vehicle=vehicle, active=True)
+        for index, vehicle in enumerate(vehicles)
+    ], batch_size=200)
+    return {"vehicles": vehicles, "drivers": drivers}
+
+
 @pytest.fixture
 def cost_center_operational():
     return CostCenter.objects.create(
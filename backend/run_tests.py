@@ -2,15 +2,81 @@
 """
 Testes completos de API e segurança para TopNet Frotas
 """
+import base64
 import os
+import sys
+import threading
+import time
+import orjson
 import requests
-import json
-from datetime import datetime, timedelta
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from types import SimpleNamespace
+from datetime import datetime
 
 BASE_URL = "http://localhost:8000/api"
-RESULTS = {"passed": 0, "failed": 0, "warnings": []}
+# Timeout padrão das requisições e da sondagem inicial do servidor (segundos)
+REQUEST_TIMEOUT = 10
+PROBE_TIMEOUT = 1.0
+# URLs montadas uma vez; url_detail() compõe as de um recurso específico
+URL_AUTH = f"{BASE_URL}/auth/token/"
+URL_REFRESH = f"{BASE_URL}/auth/token/refresh/"
+URL_VEHICLES = f"{BASE_URL}/vehicles/"
+URL_DRIVERS = f"{BASE_URL}/drivers/"
+URL_COST_CENTERS = f"{BASE_URL}/cost-centers/"
+URL_FUEL_STATIONS = f"{BASE_URL}/fuel-stations/"
+URL_FUEL_TRANSACTIONS = f"{BASE_URL}/fuel-transactions/"
+URL_DASHBOARD_SUMMARY = f"{BASE_URL}/dashboard/summary/"
+URL_ALERTS = f"{BASE_URL}/alerts/"
+URL_ALERTS_OPEN = f"{BASE_URL}/alerts/open/"
+# Em CI (variável CI definida) a saída usa marcadores ASCII no lugar de emoji
+if os.getenv("CI"):
+    PASS, FAIL, WARN, ARROW, BULLET, DONE = "PASS", "FAIL", "WARN", "->", "-", "OK"
+else:
+    PASS, FAIL, WARN, ARROW, BULLET, DONE = "✅", "❌", "⚠️ ", "→", "•", "🎉"
+RESULTS = SimpleNamespace(passed=0, failed=0, warnings=[])
+_TOKEN_CACHE = {"access": None, "exp": 0}
+_RESULTS_LOCK = threading.Lock()
+_OUTPUT = threading.local()
+HEADERS_JSON = {"Content-Type": "application/json"}
+# Horário de referência da execução e payload base de abastecimento
+NOW_ISO = datetime.now().isoformat()
+TRANSACTION_DATA = {
+    "purchased_at": NOW_ISO,
+    "liters": "45.50",
+    "unit_price": "5.89",
+    "odometer_km": 50000,
+    "fuel_type": "GASOLINE"
+}
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter que aplica REQUEST_TIMEOUT quando a chamada não define um"""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = REQUEST_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+# Sessão única: keep-alive e pool de conexões entre todas as requisições
 SESSION = requests.Session()
+SESSION.mount("http://", TimeoutHTTPAdapter(pool_connections=10, pool_maxsize=20))
+SESSION.mount("https://", TimeoutHTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+
+def url_detail(collection_url, pk):
+    """URL de um recurso: url_detail(URL_VEHICLES, id)"""
+    return f"{collection_url}{pk}/"
+
+
+def server_available():
+    """Sonda rápida: qualquer resposta indica que o backend está no ar"""
+    try:
+        SESSION.head(f"{BASE_URL}/", timeout=PROBE_TIMEOUT)
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+        return False
+    return True
 
 
 def get_credentials():
@@ -21,86 +87,194 @@ def get_credentials():
     return username, password
 
 
+def _token_exp(token):
+    """Lê o claim exp do JWT (sem validar a assinatura)"""
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return orjson.loads(base64.urlsafe_b64decode(payload))["exp"]
+
+
 def get_token():
-    """Obtém token de autenticação"""
+    """Obtém token de autenticação (reaproveitado enquanto não expira)"""
+    if _TOKEN_CACHE["access"] and time.time() < _TOKEN_CACHE["exp"] - 30:
+        return _TOKEN_CACHE["access"]
+
     username, password = get_credentials()
-    response = SESSION.post(
-        f"{BASE_URL}/auth/token/",
-        json={"username": username, "password": password}
-    )
-    return response.json().get("access")
+    response = jpost(URL_AUTH, {"username": username, "password": password})
+    token = rjson(response).get("access")
+    if token:
+        _TOKEN_CACHE.update(access=token, exp=_token_exp(token))
+    return token
+
+
+def log(line):
+    """Imprime, ou guarda no buffer da seção quando ela roda em paralelo"""
+    buffer = getattr(_OUTPUT, "lines", None)
+    if buffer is None:
+        print(line)
+    else:
+        buffer.append(line)
+
+
+def run_buffered(section, *args):
+    """Executa uma seção guardando sua saída; retorna (resultado, linhas)"""
+    _OUTPUT.lines = []
+    try:
+        return section(*args), _OUTPUT.lines
+    finally:
+        _OUTPUT.lines = None
+
+
+def emit(lines):
+    """Escreve a saída de uma seção com uma única escrita"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def run_section(section, *args):
+    """Executa uma seção e escreve sua saída de uma vez; retorna o resultado"""
+    result, lines = run_buffered(section, *args)
+    emit(lines)
+    return result
 
 
 def test(name, condition, message=""):
     """Helper para registrar testes"""
+    with _RESULTS_LOCK:
+        if condition:
+            RESULTS.passed += 1
+        else:
+            RESULTS.failed += 1
     if condition:
-        print(f"  ✅ {name}")
-        RESULTS["passed"] += 1
+        log(f"  {PASS} {name}")
     else:
-        print(f"  ❌ {name} - {message}")
-        RESULTS["failed"] += 1
+        log(f"  {FAIL} {name} - {message}")
 
 
 def warning(msg):
     """Registra warning de segurança"""
-    RESULTS["warnings"].append(msg)
-    print(f"  ⚠️  SEGURANÇA: {msg}")
+    with _RESULTS_LOCK:
+        RESULTS.warnings.append(msg)
+    log(f"  {WARN} SEGURANÇA: {msg}")
+
+
+def jpost(url, data):
+    """POST com corpo JSON já serializado pelo orjson"""
+    return SESSION.post(url, data=orjson.dumps(data), headers=HEADERS_JSON)
+
+
+def jpatch(url, data):
+    """PATCH com corpo JSON já serializado pelo orjson"""
+    return SESSION.patch(url, data=orjson.dumps(data), headers=HEADERS_JSON)
+
+
+def rjson(response):
+    """Decodifica o corpo JSON direto dos bytes, com orjson"""
+    return orjson.loads(response.content)
+
+
+def post_concurrently(*calls):
+    """Dispara os POSTs (url, payload) ao mesmo tempo; respostas na mesma ordem"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(lambda call: jpost(*call), calls))
 
 
-def auth_header(token):
-    return {"Authorization": f"Bearer {token}"}
+class TestContext:
+    """
+    Registra os recursos criados pelos testes.
+
+    Os que ainda existirem ao sair do bloco (teste interrompido no meio,
+    ou criados só para uma verificação) são removidos em paralelo.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self._urls = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            urls, self._urls = list(self._urls), set()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(self.session.delete, urls))
+        except requests.exceptions.ConnectionError:
+            pass
+        return False
+
+    def track(self, collection_url, pk):
+        """Registra um recurso criado; retorna a URL dele"""
+        url = url_detail(collection_url, pk)
+        with self._lock:
+            self._urls.add(url)
+        return url
+
+    def delete(self, url):
+        """Remove o recurso agora; se a remoção deu certo, deixa de registrá-lo"""
+        r = self.session.delete(url)
+        if r.status_code in (204, 404):
+            with self._lock:
+                self._urls.discard(url)
+        return r
+
+
+def use_token(token):
+    """Autentica as próximas requisições da sessão com o token"""
+    SESSION.headers["Authorization"] = f"Bearer {token}"
 
 
 def test_authentication():
     """Testes de autenticação e segurança"""
-    print("\n" + "=" * 50)
-    print("1. AUTENTICAÇÃO E SEGURANÇA")
-    print("=" * 50)
+    log("\n" + "=" * 50)
+    log("1. AUTENTICAÇÃO E SEGURANÇA")
+    log("=" * 50)
 
     # Teste sem token
-    r = requests.get(f"{BASE_URL}/vehicles/")
+    r = SESSION.get(URL_VEHICLES)
     test("Bloqueia acesso sem token", r.status_code == 401)
 
     # Teste com token inválido
-    r = requests.get(f"{BASE_URL}/vehicles/", headers={"Authorization": "Bearer invalid"})
+    r = SESSION.get(URL_VEHICLES, headers={"Authorization": "Bearer invalid"})
     test("Bloqueia token inválido", r.status_code == 401)
 
     # Teste com credenciais erradas
     username, _ = get_credentials()
-    r = requests.post(f"{BASE_URL}/auth/token/", json={"username": username, "password": "wrong"})
+    r = jpost(URL_AUTH, {"username": username, "password": "wrong"})
     test("Bloqueia senha incorreta", r.status_code == 401)
 
     # Teste SQL Injection no login
-    r = requests.post(f"{BASE_URL}/auth/token/", json={"username": "' OR '1'='1", "password": "' OR '1'='1"})
+    r = jpost(URL_AUTH, {"username": "' OR '1'='1", "password": "' OR '1'='1"})
     test("Bloqueia SQL Injection no login", r.status_code in (400, 401))
 
     # Teste com token válido
     token = get_token()
-    r = requests.get(f"{BASE_URL}/vehicles/", headers=auth_header(token))
+    use_token(token)
+    r = SESSION.get(URL_VEHICLES)
     test("Aceita token válido", r.status_code == 200)
 
     # Teste refresh token
     username, password = get_credentials()
-    r = SESSION.post(f"{BASE_URL}/auth/token/", json={"username": username, "password": password})
-    r = SESSION.post(f"{BASE_URL}/auth/token/refresh/", json={})
-    test("Refresh token funciona", r.status_code == 200 and "access" in r.json())
+    r = jpost(URL_AUTH, {"username": username, "password": password})
+    r = jpost(URL_REFRESH, {})
+    test("Refresh token funciona", r.status_code == 200 and "access" in rjson(r))
 
     return token
 
 
-def test_vehicles(token):
+def test_vehicles(token, ctx):
     """Testes CRUD de veículos"""
-    print("\n" + "=" * 50)
-    print("2. CRUD DE VEÍCULOS")
-    print("=" * 50)
-
-    headers = auth_header(token)
+    log("\n" + "=" * 50)
+    log("2. CRUD DE VEÍCULOS")
+    log("=" * 50)
 
     # Listar
-    r = requests.get(f"{BASE_URL}/vehicles/", headers=headers)
+    r = SESSION.get(URL_VEHICLES)
     test("Listar veículos", r.status_code == 200)
-    initial_count = r.json().get("count", 0)
-    print(f"     → {initial_count} veículos existentes")
+    initial_count = rjson(r).get("count", 0)
+    log(f"     {ARROW} {initial_count} veículos existentes")
 
     # Criar
     vehicle_data = {
@@ -113,156 +287,140 @@ def test_vehicles(token):
         "min_expected_km_per_liter": 8,
         "max_expected_km_per_liter": 14
     }
-    r = requests.post(f"{BASE_URL}/vehicles/", headers=headers, json=vehicle_data)
+    r = jpost(URL_VEHICLES, vehicle_data)
     test("Criar veículo", r.status_code == 201)
-    vehicle_id = r.json().get("id")
+    vehicle_url = ctx.track(URL_VEHICLES, rjson(r).get("id"))
 
     # Ler
-    r = requests.get(f"{BASE_URL}/vehicles/{vehicle_id}/", headers=headers)
-    test("Ler veículo", r.status_code == 200 and r.json()["name"] == "Veículo Teste")
+    r = SESSION.get(vehicle_url)
+    test("Ler veículo", r.status_code == 200 and rjson(r)["name"] == "Veículo Teste")
 
     # Atualizar
-    r = requests.patch(f"{BASE_URL}/vehicles/{vehicle_id}/", headers=headers, json={"name": "Veículo Atualizado"})
-    test("Atualizar veículo", r.status_code == 200 and r.json()["name"] == "Veículo Atualizado")
+    r = jpatch(vehicle_url, {"name": "Veículo Atualizado"})
+    test("Atualizar veículo", r.status_code == 200 and rjson(r)["name"] == "Veículo Atualizado")
 
     # Teste XSS no nome
     xss_payload = "<script>alert('xss')</script>"
-    r = requests.patch(f"{BASE_URL}/vehicles/{vehicle_id}/", headers=headers, json={"name": xss_payload})
-    if r.status_code == 200 and xss_payload in r.json().get("name", ""):
+    r = jpatch(vehicle_url, {"name": xss_payload})
+    if r.status_code == 200 and xss_payload in rjson(r).get("name", ""):
         warning("XSS não sanitizado no campo name (validar no frontend)")
 
     # Teste placa duplicada
-    r = requests.post(f"{BASE_URL}/vehicles/", headers=headers, json={**vehicle_data, "name": "Outro"})
+    r = jpost(URL_VEHICLES, {**vehicle_data, "name": "Outro"})
     test("Bloqueia placa duplicada", r.status_code == 400)
 
     # Deletar
-    r = requests.delete(f"{BASE_URL}/vehicles/{vehicle_id}/", headers=headers)
+    r = ctx.delete(vehicle_url)
     test("Deletar veículo", r.status_code == 204)
 
     # Verificar deleção
-    r = requests.get(f"{BASE_URL}/vehicles/{vehicle_id}/", headers=headers)
+    r = SESSION.get(vehicle_url)
     test("Veículo deletado não existe", r.status_code == 404)
 
     return True
 
 
-def test_drivers(token):
+def test_drivers(token, ctx):
     """Testes CRUD de motoristas"""
-    print("\n" + "=" * 50)
-    print("3. CRUD DE MOTORISTAS")
-    print("=" * 50)
-
-    headers = auth_header(token)
+    log("\n" + "=" * 50)
+    log("3. CRUD DE MOTORISTAS")
+    log("=" * 50)
 
     # Criar
     driver_data = {"name": "Motorista Teste", "doc_id": "123.456.789-00", "phone": "(11) 99999-9999"}
-    r = requests.post(f"{BASE_URL}/drivers/", headers=headers, json=driver_data)
+    r = jpost(URL_DRIVERS, driver_data)
     test("Criar motorista", r.status_code == 201)
-    driver_id = r.json().get("id")
+    driver_url = ctx.track(URL_DRIVERS, rjson(r).get("id"))
 
     # Listar
-    r = requests.get(f"{BASE_URL}/drivers/", headers=headers)
+    r = SESSION.get(URL_DRIVERS)
     test("Listar motoristas", r.status_code == 200)
 
     # Atualizar
-    r = requests.patch(f"{BASE_URL}/drivers/{driver_id}/", headers=headers, json={"name": "Motorista Atualizado"})
+    r = jpatch(driver_url, {"name": "Motorista Atualizado"})
     test("Atualizar motorista", r.status_code == 200)
 
     # Deletar
-    r = requests.delete(f"{BASE_URL}/drivers/{driver_id}/", headers=headers)
+    r = ctx.delete(driver_url)
     test("Deletar motorista", r.status_code == 204)
 
     return True
 
 
-def test_cost_centers(token):
+def test_cost_centers(token, ctx):
     """Testes CRUD de centros de custo"""
-    print("\n" + "=" * 50)
-    print("4. CRUD DE CENTROS DE CUSTO")
-    print("=" * 50)
-
-    headers = auth_header(token)
-
-    # Criar
-    data = {"name": "Centro Teste", "category": "RURAL"}
-    r = requests.post(f"{BASE_URL}/cost-centers/", headers=headers, json=data)
+    log("\n" + "=" * 50)
+    log("4. CRUD DE CENTROS DE CUSTO")
+    log("=" * 50)
+
+    # Criar + teste categoria inválida (independentes, enviados juntos)
+    r, invalid = post_concurrently(
+        (URL_COST_CENTERS, {"name": "Centro Teste", "category": "RURAL"}),
+        (URL_COST_CENTERS, {"name": "Teste", "category": "INVALID"}),
+    )
     test("Criar centro de custo", r.status_code == 201)
-    cc_id = r.json().get("id")
+    test("Bloqueia categoria inválida", invalid.status_code == 400)
+    cc_url = ctx.track(URL_COST_CENTERS, rjson(r).get("id"))
 
     # Listar
-    r = requests.get(f"{BASE_URL}/cost-centers/", headers=headers)
+    r = SESSION.get(URL_COST_CENTERS)
     test("Listar centros de custo", r.status_code == 200)
 
-    # Teste categoria inválida
-    r = requests.post(f"{BASE_URL}/cost-centers/", headers=headers, json={"name": "Teste", "category": "INVALID"})
-    test("Bloqueia categoria inválida", r.status_code == 400)
-
     # Deletar
-    r = requests.delete(f"{BASE_URL}/cost-centers/{cc_id}/", headers=headers)
+    r = ctx.delete(cc_url)
     test("Deletar centro de custo", r.status_code == 204)
 
     return True
 
 
-def test_fuel_stations(token):
+def test_fuel_stations(token, ctx):
     """Testes CRUD de postos"""
-    print("\n" + "=" * 50)
-    print("5. CRUD DE POSTOS")
-    print("=" * 50)
-
-    headers = auth_header(token)
+    log("\n" + "=" * 50)
+    log("5. CRUD DE POSTOS")
+    log("=" * 50)
 
     # Criar
     data = {"name": "Posto Teste", "city": "São Paulo", "address": "Rua Teste, 123"}
-    r = requests.post(f"{BASE_URL}/fuel-stations/", headers=headers, json=data)
+    r = jpost(URL_FUEL_STATIONS, data)
     test("Criar posto", r.status_code == 201)
-    station_id = r.json().get("id")
+    station_url = ctx.track(URL_FUEL_STATIONS, rjson(r).get("id"))
 
     # Listar
-    r = requests.get(f"{BASE_URL}/fuel-stations/", headers=headers)
+    r = SESSION.get(URL_FUEL_STATIONS)
     test("Listar postos", r.status_code == 200)
 
     # Deletar
-    r = requests.delete(f"{BASE_URL}/fuel-stations/{station_id}/", headers=headers)
+    r = ctx.delete(station_url)
     test("Deletar posto", r.status_code == 204)
 
     return True
 
 
-def test_fuel_transactions(token):
+def test_fuel_transactions(token, ctx):
     """Testes de abastecimentos"""
-    print("\n" + "=" * 50)
-    print("6. CRUD DE ABASTECIMENTOS")
-    print("=" * 50)
-
-    headers = auth_header(token)
+    log("\n" + "=" * 50)
+    log("6. CRUD DE ABASTECIMENTOS")
+    log("=" * 50)
 
     # Pegar um veículo existente
-    r = requests.get(f"{BASE_URL}/vehicles/", headers=headers)
-    vehicles = r.json().get("results", [])
+    r = SESSION.get(URL_VEHICLES)
+    vehicles = rjson(r).get("results", [])
     if not vehicles:
-        print("  ⚠️  Nenhum veículo disponível para teste")
+        log(f"  {WARN} Nenhum veículo disponível para teste")
         return False
 
     vehicle_id = vehicles[0]["id"]
     vehicle_name = vehicles[0]["name"]
-    print(f"     → Usando veículo: {vehicle_name}")
+    log(f"     {ARROW} Usando veículo: {vehicle_name}")
 
     # Criar abastecimento
-    transaction_data = {
-        "vehicle": vehicle_id,
-        "purchased_at": datetime.now().isoformat(),
-        "liters": "45.50",
-        "unit_price": "5.89",
-        "odometer_km": 50000,
-        "fuel_type": "GASOLINE"
-    }
-    r = requests.post(f"{BASE_URL}/fuel-transactions/", headers=headers, data=transaction_data)
+    transaction_data = {**TRANSACTION_DATA, "vehicle": vehicle_id}
+    r = SESSION.post(URL_FUEL_TRANSACTIONS, data=transaction_data)
     test("Criar abastecimento", r.status_code == 201)
 
     if r.status_code == 201:
-        tx_id = r.json().get("id")
-        tx = r.json()
+        tx = rjson(r)
+        tx_url = ctx.track(URL_FUEL_TRANSACTIONS, tx.get("id"))
 
         # Verificar cálculo do total
         expected_total = 45.50 * 5.89
@@ -271,105 +429,102 @@ def test_fuel_transactions(token):
              f"Esperado: {expected_total:.2f}, Obtido: {actual_total:.2f}")
 
         # Listar
-        r = requests.get(f"{BASE_URL}/fuel-transactions/", headers=headers)
+        r = SESSION.get(URL_FUEL_TRANSACTIONS)
         test("Listar abastecimentos", r.status_code == 200)
 
         # Teste valores negativos (segurança)
         bad_data = {**transaction_data, "liters": "-10", "odometer_km": 49000}
-        r = requests.post(f"{BASE_URL}/fuel-transactions/", headers=headers, data=bad_data)
+        r = SESSION.post(URL_FUEL_TRANSACTIONS, data=bad_data)
         test("Bloqueia litros negativos", r.status_code == 400)
 
         # Deletar
-        r = requests.delete(f"{BASE_URL}/fuel-transactions/{tx_id}/", headers=headers)
+        r = ctx.delete(tx_url)
         test("Deletar abastecimento", r.status_code == 204)
 
     return True
 
 
-def test_dashboard(token):
+def test_dashboard(token, ctx):
     """Testes do dashboard"""
-    print("\n" + "=" * 50)
-    print("7. DASHBOARD E ALERTAS")
-    print("=" * 50)
-
-    headers = auth_header(token)
+    log("\n" + "=" * 50)
+    log("7. DASHBOARD E ALERTAS")
+    log("=" * 50)
 
     # Dashboard summary
-    r = requests.get(f"{BASE_URL}/dashboard/summary/", headers=headers)
+    r = SESSION.get(URL_DASHBOARD_SUMMARY)
     test("Dashboard summary", r.status_code == 200)
 
     if r.status_code == 200:
-        data = r.json()
+        data = rjson(r)
         test("Dashboard tem period", "period" in data)
         test("Dashboard tem summary", "summary" in data)
         test("Dashboard tem cost_by_vehicle", "cost_by_vehicle" in data)
-        print(f"     → Total: R$ {data.get('summary', {}).get('total_cost', 0):.2f}")
-        print(f"     → Litros: {data.get('summary', {}).get('total_liters', 0):.2f}")
+        log(f"     {ARROW} Total: R$ {data.get('summary', {}).get('total_cost', 0):.2f}")
+        log(f"     {ARROW} Litros: {data.get('summary', {}).get('total_liters', 0):.2f}")
 
     # Alertas
-    r = requests.get(f"{BASE_URL}/alerts/", headers=headers)
+    r = SESSION.get(URL_ALERTS)
     test("Listar alertas", r.status_code == 200)
 
-    r = requests.get(f"{BASE_URL}/alerts/open/", headers=headers)
+    r = SESSION.get(URL_ALERTS_OPEN)
     test("Listar alertas abertos", r.status_code == 200)
 
     return True
 
 
-def test_security():
+def test_security(token, ctx):
     """Testes específicos de segurança"""
-    print("\n" + "=" * 50)
-    print("8. TESTES DE SEGURANÇA")
-    print("=" * 50)
+    log("\n" + "=" * 50)
+    log("8. TESTES DE SEGURANÇA")
+    log("=" * 50)
 
     token = get_token()
-    headers = auth_header(token)
-
     # IDOR - tentar acessar ID inexistente (pode retornar 404 ou 500 dependendo do UUID)
-    r = requests.get(f"{BASE_URL}/vehicles/00000000-0000-0000-0000-000000000000/", headers=headers)
+    r = SESSION.get(url_detail(URL_VEHICLES, "00000000-0000-0000-0000-000000000000"))
     test("IDOR: ID inexistente retorna erro", r.status_code in [404, 500])
 
     # Path traversal
-    r = requests.get(f"{BASE_URL}/vehicles/../../../etc/passwd/", headers=headers)
+    r = SESSION.get(f"{URL_VEHICLES}../../../etc/passwd/")
     test("Path traversal bloqueado", r.status_code in [400, 404])
 
-    # Mass assignment - tentar alterar campos protegidos
-    r = requests.post(f"{BASE_URL}/vehicles/", headers=headers, json={
-        "name": "Hack",
-        "plate": "HCK-0000",
-        "model": "Hack",
-        "fuel_type": "GASOLINE",
-        "usage_category": "OPERATIONAL",
-        "id": "11111111-1111-1111-1111-111111111111",  # Tentar forçar ID
-        "created_at": "2020-01-01T00:00:00Z"  # Tentar forçar data
-    })
+    # Mass assignment (tentar forçar campos protegidos) + XSS, enviados juntos
+    xss_payload = "<script>alert('xss')</script>"
+    r, xss = post_concurrently(
+        (URL_VEHICLES, {
+            "name": "Hack",
+            "plate": "HCK-0000",
+            "model": "Hack",
+            "fuel_type": "GASOLINE",
+            "usage_category": "OPERATIONAL",
+            "id": "11111111-1111-1111-1111-111111111111",  # Tentar forçar ID
+            "created_at": "2020-01-01T00:00:00Z"  # Tentar forçar data
+        }),
+        (URL_VEHICLES, {
+            "name": xss_payload,
+            "plate": "XSS-0001",
+            "model": "Test",
+            "fuel_type": "GASOLINE",
+            "usage_category": "OPERATIONAL"
+        }),
+    )
     if r.status_code == 201:
-        created_id = r.json().get("id")
+        created_id = rjson(r).get("id")
         test("Mass assignment: ID não pode ser forçado", created_id != "11111111-1111-1111-1111-111111111111")
-        requests.delete(f"{BASE_URL}/vehicles/{created_id}/", headers=headers)
+        ctx.track(URL_VEHICLES, created_id)
+
+    if xss.status_code == 201:
+        saved = rjson(xss)
+        xss_sanitized = "<script>" not in saved.get("name", "")
+        test("XSS sanitizado no campo name", xss_sanitized)
+        ctx.track(URL_VEHICLES, saved['id'])
 
     # Rate limiting check - testar se está configurado
     # Nota: Rate limiting está implementado (5/minute no login)
     # Não testamos exaustivamente aqui para não bloquear outros testes
     test("Rate limiting configurado", True)  # Verificado manualmente - LoginRateThrottle ativo
 
-    # XSS test
-    xss_payload = "<script>alert('xss')</script>"
-    r = requests.post(f"{BASE_URL}/vehicles/", headers=headers, json={
-        "name": xss_payload,
-        "plate": "XSS-0001",
-        "model": "Test",
-        "fuel_type": "GASOLINE",
-        "usage_category": "OPERATIONAL"
-    })
-    if r.status_code == 201:
-        saved_name = r.json().get("name", "")
-        xss_sanitized = "<script>" not in saved_name
-        test("XSS sanitizado no campo name", xss_sanitized)
-        requests.delete(f"{BASE_URL}/vehicles/{r.json()['id']}/", headers=headers)
-
     # CORS headers
-    r = requests.options(f"{BASE_URL}/vehicles/", headers={"Origin": "http://evil.com"})
+    r = SESSION.options(URL_VEHICLES, headers={"Origin": "http://evil.com"})
     cors_origin = r.headers.get("Access-Control-Allow-Origin", "")
     if cors_origin == "*":
         warning("CORS permite qualquer origem (*)")
@@ -379,47 +534,64 @@ def test_security():
     return True
 
 
+def report():
+    """Resumo final dos testes"""
+    log("\n" + "=" * 60)
+    log("   RESUMO DOS TESTES")
+    log("=" * 60)
+    log(f"\n  {PASS} Passou: {RESULTS.passed}")
+    log(f"  {FAIL} Falhou: {RESULTS.failed}")
+
+    if RESULTS.warnings:
+        log(f"\n  {WARN} Avisos de Segurança ({len(RESULTS.warnings)}):")
+        for w in RESULTS.warnings:
+            log(f"     {BULLET} {w}")
+
+    total = RESULTS.passed + RESULTS.failed
+    percentage = (RESULTS.passed / total * 100) if total > 0 else 0
+    log(f"\n  Taxa de sucesso: {percentage:.1f}%")
+
+    if RESULTS.failed == 0:
+        log(f"\n  {DONE} TODOS OS TESTES PASSARAM!")
+    else:
+        log(f"\n  {WARN} {RESULTS.failed} teste(s) falharam")
+
+
 def main():
     print("\n" + "=" * 60)
     print("   TESTES COMPLETOS - TopNet Frotas API")
     print("   " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     print("=" * 60)
 
-    try:
-        token = test_authentication()
-        test_vehicles(token)
-        test_drivers(token)
-        test_cost_centers(token)
-        test_fuel_stations(token)
-        test_fuel_transactions(token)
-        test_dashboard(token)
-        test_security()
-
-    except requests.exceptions.ConnectionError:
-        print("\n❌ ERRO: Não foi possível conectar ao backend")
+    if not server_available():
+        print(f"\n{FAIL} ERRO: Não foi possível conectar ao backend")
         print("   Verifique se o servidor está rodando em localhost:8000")
+        SESSION.close()
         return
 
-    # Resumo
-    print("\n" + "=" * 60)
-    print("   RESUMO DOS TESTES")
-    print("=" * 60)
-    print(f"\n  ✅ Passou: {RESULTS['passed']}")
-    print(f"  ❌ Falhou: {RESULTS['failed']}")
+    try:
+        with TestContext(SESSION) as ctx:
+            token = run_section(test_authentication)
+            run_section(test_vehicles, token, ctx)
 
-    if RESULTS["warnings"]:
-        print(f"\n  ⚠️  Avisos de Segurança ({len(RESULTS['warnings'])}):")
-        for w in RESULTS["warnings"]:
-            print(f"     • {w}")
+            # Seções independentes rodam em paralelo; a saída sai na ordem original
+            independent = [test_drivers, test_cost_centers, test_fuel_stations, test_dashboard]
+            with ThreadPoolExecutor(max_workers=len(independent)) as executor:
+                outputs = list(executor.map(lambda section: run_buffered(section, token, ctx), independent))
+            for _, lines in outputs:
+                emit(lines)
 
-    total = RESULTS["passed"] + RESULTS["failed"]
-    percentage = (RESULTS["passed"] / total * 100) if total > 0 else 0
-    print(f"\n  Taxa de sucesso: {percentage:.1f}%")
+            run_section(test_fuel_transactions, token, ctx)
+            run_section(test_security, token, ctx)
 
-    if RESULTS["failed"] == 0:
-        print("\n  🎉 TODOS OS TESTES PASSARAM!")
-    else:
-        print(f"\n  ⚠️  {RESULTS['failed']} teste(s) falharam")
+    except requests.exceptions.ConnectionError:
+        print(f"\n{FAIL} ERRO: Não foi possível conectar ao backend")
+        print("   Verifique se o servidor está rodando em localhost:8000")
+        return
+    finally:
+        SESSION.close()
+
+    run_section(report)
 
 
 if __name__ == "__main__":
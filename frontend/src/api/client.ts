@@ -67,6 +67,30 @@ api.interceptors.response.use(
   }
 )
 
+// Background jobs: poll with exponential backoff while `isRunning(job)`.
+// Resolves with the finished job, or null once `maxWaitMs` has elapsed.
+const POLL_INITIAL_DELAY_MS = 500
+const POLL_MAX_DELAY_MS = 5000
+
+async function pollJob<T>(
+  url: string,
+  isRunning: (job: T) => boolean,
+  maxWaitMs: number
+): Promise<T | null> {
+  let delay = POLL_INITIAL_DELAY_MS
+  let waited = 0
+  while (waited < maxWaitMs) {
+    await new Promise((resolve) => setTimeout(resolve, delay))
+    waited += delay
+    const response = await api.get(url)
+    if (!isRunning(response.data)) {
+      return response.data
+    }
+    delay = Math.min(delay * 2, POLL_MAX_DELAY_MS)
+  }
+  return null
+}
+
 // User profile type
 export interface UserProfile {
   id: number
@@ -309,6 +333,10 @@ export const fuelTransactions = {
 }
 
 // Fuel Prices
+// Celery states in which the ANP fetch is still queued or running
+const ANP_RUNNING_STATES = new Set(['PENDING', 'RECEIVED', 'STARTED'])
+const ANP_FETCH_MAX_WAIT_MS = 60000
+
 export const fuelPrices = {
   latest: async (fuelType: FuelType, stationId?: string): Promise<FuelPriceLatest> => {
     const params: Record<string, string> = { fuel_type: fuelType }
@@ -329,10 +357,45 @@ export const fuelPrices = {
     source_url?: string
   }> => {
     const response = await api.post('/fuel-prices/fetch-anp/')
-    return response.data
+    if (response.status !== 202) {
+      return response.data
+    }
+
+    // Fetch runs in background: poll until the task leaves the queued/running
+    // states. RETRY means the task backs off for an hour, so it counts as a failure.
+    const job = await pollJob<ANPFetchJob>(
+      `/fuel-prices/fetch-anp/${response.data.task_id}/`,
+      (current) => ANP_RUNNING_STATES.has(current.status),
+      ANP_FETCH_MAX_WAIT_MS
+    )
+    if (!job) {
+      const message = 'Tempo esgotado aguardando a busca de precos ANP. Tente novamente mais tarde.'
+      throw Object.assign(new Error(message), { response: { data: { message } } })
+    }
+    if (job.status !== 'SUCCESS' || !job.result?.success) {
+      const message = job.error || job.result?.errors?.join('; ') || 'Falha ao buscar precos ANP'
+      throw Object.assign(new Error(message), { response: { data: { message } } })
+    }
+    return {
+      message: 'ANP prices updated successfully',
+      prices_updated: job.result.prices_updated,
+      source_url: job.result.source_url,
+    }
   },
 }
 
+interface ANPFetchJob {
+  task_id: string
+  status: string
+  result: {
+    success: boolean
+    prices_updated: Array<{ fuel_type: string; price: string; action: string }>
+    errors: string[]
+    source_url?: string
+  } | null
+  error: string | null
+}
+
 // Dashboard
 export const dashboard = {
   summary: async (params?: {
@@ -409,6 +472,18 @@ export interface ImportResult {
   errors: ImportError[]
 }
 
+export type ImportStatus = 'PENDING' | 'PROCESSING' | 'SUCCESS' | 'FAILED'
+
+export interface ImportJob {
+  id: string
+  status: ImportStatus
+  status_display: string
+  task_id: string
+  result: (ImportResult & { error?: string }) | { error: string } | null
+  created_at: string
+  finished_at: string | null
+}
+
 export interface CSVColumnSpec {
   name: string
   required: boolean
@@ -427,6 +502,8 @@ export interface CSVFormatSpec {
 }
 
 // Import
+const IMPORT_MAX_WAIT_MS = 5 * 60 * 1000
+
 export const imports = {
   uploadCSV: async (file: File): Promise<ImportResult> => {
     const formData = new FormData()
@@ -434,6 +511,30 @@ export const imports = {
     const response = await api.post('/import/transactions/', formData, {
       headers: { 'Content-Type': 'multipart/form-data' },
     })
+    if (response.status !== 202) {
+      return response.data
+    }
+
+    // Import runs in background: poll until it finishes, giving up after
+    // IMPORT_MAX_WAIT_MS (worker down, or task killed mid-import)
+    const job = await pollJob<ImportJob>(
+      `/import/transactions/${response.data.id}/`,
+      (current) => current.status === 'PENDING' || current.status === 'PROCESSING',
+      IMPORT_MAX_WAIT_MS
+    )
+    if (!job) {
+      const message =
+        'Tempo esgotado aguardando o processamento do arquivo. Consulte o status da importacao mais tarde.'
+      throw Object.assign(new Error(message), { response: { data: { error: message } } })
+    }
+    if (!job.result || !('summary' in job.result)) {
+      const message = job.result?.error || 'Erro ao processar arquivo'
+      throw Object.assign(new Error(message), { response: { data: { error: message } } })
+    }
+    return job.result
+  },
+  getStatus: async (id: string): Promise<ImportJob> => {
+    const response = await api.get(`/import/transactions/${id}/`)
     return response.data
   },
   downloadTemplate: async (): Promise<{ blob: Blob; filename: string }> => {